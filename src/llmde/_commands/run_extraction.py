@@ -6,10 +6,11 @@ import re
 import shutil
 import time
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
 
-from ..models import GeminiModel
+from ..models import BatchRequest, GeminiModel
 from ..utils._text import strip_markdown_fences
 from ._utils import (
     get_api_key,
@@ -18,6 +19,12 @@ from ._utils import (
     get_system_instruction_text,
 )
 
+if TYPE_CHECKING:
+    from ..models._base import BaseModel
+
+# record of the batch submitted and not yet saved, to resume an interrupted run
+_BATCH_FILE: str = "BATCH.json"
+
 
 def _sort_pdf_files(src: Path) -> list[Path]:
     """Sort PDF files, using numeric suffix ordering when detected.
@@ -75,6 +82,141 @@ def _parse_prompts(prompts_str: str) -> list[tuple[Path, Path | None]]:
     return prompt_data
 
 
+def _prepare_pdf_output(out: Path, pdf_idx: int, pdf_path: Path) -> Path:
+    """Create the numbered output directory of a PDF and copy the PDF in it.
+
+    Parameters
+    ----------
+    out : Path
+        Output directory for extraction results.
+    pdf_idx : int
+        Index of the PDF, starting at 1.
+    pdf_path : Path
+        Path to the PDF file.
+
+    Returns
+    -------
+    Path
+        The numbered output directory of the PDF.
+    """
+    pdf_output_dir = out / f"{pdf_idx:03d}"
+    pdf_output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Copy PDF with original name
+    output_pdf_path = pdf_output_dir / pdf_path.name
+    if not output_pdf_path.exists():
+        shutil.copy2(pdf_path, output_pdf_path)
+        click.echo(f"✓ PDF copied: {pdf_path.name}")
+    else:
+        click.echo(f"⊘ PDF exists: {pdf_path.name}")
+    return pdf_output_dir
+
+
+def _save_response(response: str, output_json_path: Path) -> None:
+    """Save a model response, as formatted JSON if it is valid JSON.
+
+    Parameters
+    ----------
+    response : str
+        The text response from the model.
+    output_json_path : Path
+        Path to the output JSON file.
+    """
+    # Strip markdown code fences if present
+    response_clean = strip_markdown_fences(response)
+
+    # Parse and save
+    try:
+        response_data = json.loads(response_clean)
+        with open(output_json_path, "w", encoding="utf-8") as f:
+            json.dump(response_data, f, indent=2, ensure_ascii=False)
+        click.echo(f"    ✓ Saved valid JSON: {output_json_path.name}")
+    except json.JSONDecodeError as exc:
+        click.echo(f"    ⚠ Invalid JSON ({exc}), saving raw text")
+        with open(output_json_path, "w", encoding="utf-8") as f:
+            f.write(response)
+
+
+def _run_batch(
+    model_instance: BaseModel,
+    prompt_data: list[tuple[Path, Path | None]],
+    pdf_files: list[Path],
+    pdf_output_dirs: list[Path],
+    out: Path,
+) -> None:
+    """Query the model through the batch API, in a single batch.
+
+    Parameters
+    ----------
+    model_instance : BaseModel
+        The model to query.
+    prompt_data : list of tuple of (Path, Path | None)
+        List of tuples (prompt_path, json_schema_path).
+    pdf_files : list of Path
+        The PDF files to analyze.
+    pdf_output_dirs : list of Path
+        The numbered output directory of each PDF.
+    out : Path
+        Output directory for extraction results, where the submitted batch is
+        recorded until its responses are saved.
+    """
+    batch_path = out / _BATCH_FILE
+    if batch_path.exists():
+        with open(batch_path, encoding="utf-8") as f:
+            batch_data = json.load(f)
+        click.echo(f"Resuming batch {batch_data['batch_id']}")
+    else:
+        # Skip the prompt x paper pairs already processed
+        requests, outputs = [], []
+        for pdf_path, pdf_output_dir in zip(pdf_files, pdf_output_dirs, strict=True):
+            for prompt_path, json_schema_path in prompt_data:
+                output_json_path = pdf_output_dir / f"{prompt_path.stem}.json"
+                if output_json_path.exists():
+                    continue
+                kwargs = (
+                    {"json_schema": json_schema_path}
+                    if isinstance(model_instance, GeminiModel)
+                    else {}
+                )
+                requests.append(BatchRequest(prompt_path, [pdf_path], kwargs))
+                outputs.append(output_json_path.relative_to(out).as_posix())
+        if len(requests) == 0:
+            click.echo("⊘ All results already exist, skipping")
+            return
+
+        click.echo(f"📝 Submitting batch of {len(requests)} requests...")
+        try:
+            batch_id = model_instance.submit_batch(requests)
+        except Exception as exc:
+            click.echo(f"✗ Error: {exc}")
+            return
+        batch_data = {"batch_id": batch_id, "outputs": outputs}
+        with open(batch_path, "w", encoding="utf-8") as f:
+            json.dump(batch_data, f, indent=2)
+        click.echo(f"✓ Submitted batch {batch_id}, recorded in {batch_path}")
+
+    click.echo("⏳ Waiting for the batch to end, this can take up to 24 hours...")
+    try:
+        responses = model_instance.wait_for_batch(batch_data["batch_id"])
+    except RuntimeError as exc:
+        # the batch ended without results, resuming it would fail again
+        batch_path.unlink()
+        click.echo(f"✗ Error: {exc}")
+        click.echo("  Run the same command again to submit a new batch.")
+        return
+    except Exception as exc:
+        click.echo(f"✗ Error: {exc}")
+        click.echo("  Run the same command again to resume waiting for the batch.")
+        return
+
+    for output, response in zip(batch_data["outputs"], responses, strict=True):
+        if response is None:
+            click.echo(f"    ✗ Error: no response for {output}")
+            continue
+        _save_response(response, out / output)
+    batch_path.unlink()
+
+
 @click.command(name="run")
 @click.option(
     "--src",
@@ -141,6 +283,14 @@ def _parse_prompts(prompts_str: str) -> list[tuple[Path, Path | None]]:
     help="Maximum tokens to generate. Set high enough for expected JSON output size. "
     "Default: 4096.",
 )
+@click.option(
+    "--batch",
+    is_flag=True,
+    default=False,
+    help="Submit the papers through the provider batch API, at a reduced cost but "
+    "with results available within up to 24 hours. An interrupted run resumes "
+    "waiting for the submitted batch when run again.",
+)
 def run(
     src: Path,
     out: Path,
@@ -152,6 +302,7 @@ def run(
     top_p: float | None,
     top_k: int | None,
     max_tokens: int,
+    batch: bool,
 ) -> None:
     """Run data extraction pipeline on PDF files.
 
@@ -215,67 +366,56 @@ def run(
     manifest_path = out / "MANIFEST.csv"
     manifest_data = []
 
-    # Process each PDF
-    for pdf_idx, pdf_path in enumerate(pdf_files, 1):
-        click.echo(f"\n[{pdf_idx}/{len(pdf_files)}] Processing: {pdf_path.name}")
-        click.echo("-" * 80)
-
-        # Create numbered output directory
-        pdf_output_dir = out / f"{pdf_idx:03d}"
-        pdf_output_dir.mkdir(parents=True, exist_ok=True)
-
-        # Copy PDF with original name
-        output_pdf_path = pdf_output_dir / pdf_path.name
-        if not output_pdf_path.exists():
-            shutil.copy2(pdf_path, output_pdf_path)
-            click.echo(f"✓ PDF copied: {pdf_path.name}")
-        else:
-            click.echo(f"⊘ PDF exists: {pdf_path.name}")
-
-        # Add to manifest
-        manifest_data.append({"index": f"{pdf_idx:03d}", "pdf_name": pdf_path.name})
-
-        # Process each prompt
-        for prompt_idx, (prompt_path, json_schema_path) in enumerate(prompt_data, 1):
-            prompt_name = prompt_path.stem
-            click.echo(f"\n  [{prompt_idx}/{len(prompt_data)}] {prompt_name}")
-
-            output_json_path = pdf_output_dir / f"{prompt_name}.json"
-
-            # Skip if already processed
-            if output_json_path.exists():
-                click.echo("    ⊘ Already exists, skipping")
-                continue
-
-            try:
-                # Query model (different signatures for different models)
-                click.echo("    📝 Querying model...")
-                if isinstance(model_instance, GeminiModel):
-                    response = model_instance.query(
-                        prompt_path, [pdf_path], json_schema_path
-                    )
-                else:  # ClaudeModel or others
-                    response = model_instance.query(prompt_path, [pdf_path])
-
-                # Strip markdown code fences if present
-                response_clean = strip_markdown_fences(response)
-
-                # Parse and save
+    if batch:
+        # Prepare all the output directories, then submit a single batch
+        pdf_output_dirs = []
+        for pdf_idx, pdf_path in enumerate(pdf_files, 1):
+            pdf_output_dirs.append(_prepare_pdf_output(out, pdf_idx, pdf_path))
+            manifest_data.append({"index": f"{pdf_idx:03d}", "pdf_name": pdf_path.name})
+        _run_batch(model_instance, prompt_data, pdf_files, pdf_output_dirs, out)
+    else:
+        # Process each PDF
+        for pdf_idx, pdf_path in enumerate(pdf_files, 1):
+            click.echo(f"\n[{pdf_idx}/{len(pdf_files)}] Processing: {pdf_path.name}")
+            click.echo("-" * 80)
+
+            # Create numbered output directory
+            pdf_output_dir = _prepare_pdf_output(out, pdf_idx, pdf_path)
+
+            # Add to manifest
+            manifest_data.append({"index": f"{pdf_idx:03d}", "pdf_name": pdf_path.name})
+
+            # Process each prompt
+            for prompt_idx, (prompt_path, json_schema_path) in enumerate(
+                prompt_data, 1
+            ):
+                prompt_name = prompt_path.stem
+                click.echo(f"\n  [{prompt_idx}/{len(prompt_data)}] {prompt_name}")
+
+                output_json_path = pdf_output_dir / f"{prompt_name}.json"
+
+                # Skip if already processed
+                if output_json_path.exists():
+                    click.echo("    ⊘ Already exists, skipping")
+                    continue
+
                 try:
-                    response_data = json.loads(response_clean)
-                    with open(output_json_path, "w", encoding="utf-8") as f:
-                        json.dump(response_data, f, indent=2, ensure_ascii=False)
-                    click.echo(f"    ✓ Saved valid JSON: {prompt_name}.json")
-                except json.JSONDecodeError as exc:
-                    click.echo(f"    ⚠ Invalid JSON ({exc}), saving raw text")
-                    with open(output_json_path, "w", encoding="utf-8") as f:
-                        f.write(response)
-
-            except Exception as exc:
-                click.echo(f"    ✗ Error: {exc}")
+                    # Query model (different signatures for different models)
+                    click.echo("    📝 Querying model...")
+                    if isinstance(model_instance, GeminiModel):
+                        response = model_instance.query(
+                            prompt_path, [pdf_path], json_schema_path
+                        )
+                    else:  # ClaudeModel or others
+                        response = model_instance.query(prompt_path, [pdf_path])
+
+                    _save_response(response, output_json_path)
+
+                except Exception as exc:
+                    click.echo(f"    ✗ Error: {exc}")
 
+                time.sleep(30)  # to avoid rate limits
             time.sleep(30)  # to avoid rate limits
-        time.sleep(30)  # to avoid rate limits
 
     # Write manifest
     click.echo(f"\nWriting manifest: {manifest_path}")
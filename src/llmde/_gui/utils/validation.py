@@ -7,8 +7,12 @@ from typing import TYPE_CHECKING
 from .config import GUIConfig
 
 if TYPE_CHECKING:
+    from PyQt6.QtGui import QPixmap
     from PyQt6.QtWidgets import QLabel, QWidget
 
+# validation pixmaps, rasterized once on first use
+_VALIDATION_PIXMAPS: dict[bool, QPixmap] = {}
+
 
 def apply_css_class(widget: QWidget, css_class: str) -> None:
     """Apply a CSS class to a widget and refresh its styling.
@@ -48,6 +52,10 @@ def set_validation_icon(icon_widget: QLabel, is_valid: bool) -> None:
     is_valid : bool
         Whether to show the valid (checkmark) or invalid (X) icon.
     """
-    icon = GUIConfig.get_validation_icon(is_valid)
-    size = GUIConfig.VALIDATION_ICON_SIZE[0]
-    icon_widget.setPixmap(icon.pixmap(size, size))
+    pixmap = _VALIDATION_PIXMAPS.get(is_valid)
+    if pixmap is None:
+        icon = GUIConfig.get_validation_icon(is_valid)
+        size = GUIConfig.VALIDATION_ICON_SIZE[0]
+        pixmap = icon.pixmap(size, size)
+        _VALIDATION_PIXMAPS[is_valid] = pixmap
+    icon_widget.setPixmap(pixmap)
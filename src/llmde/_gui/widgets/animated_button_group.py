@@ -4,13 +4,159 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from PyQt6.QtCore import QPropertyAnimation, Qt, pyqtSignal
-from PyQt6.QtWidgets import QHBoxLayout, QPushButton, QWidget
+from PyQt6.QtCore import (
+    QAbstractAnimation,
+    QEvent,
+    QSize,
+    Qt,
+    QVariantAnimation,
+    pyqtSignal,
+)
+from PyQt6.QtGui import QColor, QFont, QFontMetrics, QIcon, QPainter, QPixmap
+from PyQt6.QtWidgets import (
+    QButtonGroup,
+    QHBoxLayout,
+    QStyle,
+    QStyleOption,
+    QToolButton,
+    QWidget,
+)
 
 from ..utils import GUIConfig, apply_css_class
 
 if TYPE_CHECKING:
-    from PyQt6.QtGui import QResizeEvent
+    from PyQt6.QtCore import QRect
+    from PyQt6.QtGui import QPaintEvent, QResizeEvent, QShowEvent
+
+_LABEL_FONT_SIZE = 14  # pixels
+# DevicePixelRatioChange is only available from Qt 6.6
+_DPR_CHANGE_EVENTS: tuple[QEvent.Type, ...] = (
+    (QEvent.Type.DevicePixelRatioChange,)
+    if hasattr(QEvent.Type, "DevicePixelRatioChange")
+    else ()
+)
+
+
+def _render_label(
+    label: str, font: QFont, color: str, size: QSize, dpr: float
+) -> QPixmap:
+    """Render a button label centered into a transparent pixmap.
+
+    Parameters
+    ----------
+    label : str
+        The text to render.
+    font : QFont
+        The font used to render the text.
+    color : str
+        The text color.
+    size : QSize
+        The size of the pixmap in device independent pixels.
+    dpr : float
+        The device pixel ratio of the pixmap.
+
+    Returns
+    -------
+    QPixmap
+        The rendered label.
+    """
+    pixmap = QPixmap(round(size.width() * dpr), round(size.height() * dpr))
+    pixmap.setDevicePixelRatio(dpr)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+    painter.setFont(font)
+    painter.setPen(QColor(color))
+    painter.drawText(
+        0, 0, size.width(), size.height(), Qt.AlignmentFlag.AlignCenter, label
+    )
+    painter.end()
+    return pixmap
+
+
+class _HighlightWidget(QWidget):
+    """Sliding highlight painted from a cached rendering of its stylesheet.
+
+    Parameters
+    ----------
+    parent : QWidget
+        The parent widget.
+
+    Notes
+    -----
+    The stylesheet background is rasterized once per size/style into a pixmap which
+    is blitted on every paint event, e.g. during the sliding animation.
+    """
+
+    def __init__(self, parent: QWidget) -> None:
+        super().__init__(parent)
+        self._cached_pixmap: QPixmap | None = None
+
+    def _render_cache(self) -> QPixmap:
+        """Render the stylesheet background into a pixmap.
+
+        Returns
+        -------
+        QPixmap
+            The rendered background, at the device pixel ratio of the widget.
+        """
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(
+            max(1, round(self.width() * dpr)), max(1, round(self.height() * dpr))
+        )
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        option = QStyleOption()
+        option.initFrom(self)
+        self.style().drawPrimitive(
+            QStyle.PrimitiveElement.PE_Widget, option, painter, self
+        )
+        painter.end()
+        return pixmap
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        """Handle paint events by blitting the cached background.
+
+        Parameters
+        ----------
+        event : QPaintEvent
+            The paint event.
+        """
+        if self._cached_pixmap is None:
+            self._cached_pixmap = self._render_cache()
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._cached_pixmap)
+        painter.end()
+
+    def resizeEvent(self, event: QResizeEvent) -> None:
+        """Handle resize events and invalidate the cached background.
+
+        Parameters
+        ----------
+        event : QResizeEvent
+            The resize event.
+        """
+        self._cached_pixmap = None
+        super().resizeEvent(event)
+
+    def changeEvent(self, event: QEvent) -> None:
+        """Handle change events and invalidate the cached background if needed.
+
+        Parameters
+        ----------
+        event : QEvent
+            The change event.
+        """
+        if event.type() in (
+            QEvent.Type.StyleChange,
+            QEvent.Type.EnabledChange,
+            QEvent.Type.PaletteChange,
+            *_DPR_CHANGE_EVENTS,
+        ):
+            self._cached_pixmap = None
+            self.update()
+        super().changeEvent(event)
 
 
 class AnimatedButtonGroup(QWidget):
@@ -35,22 +181,29 @@ class AnimatedButtonGroup(QWidget):
         if len(button_labels) == 0:
             raise ValueError("button_labels must not be empty")
         self._button_labels = button_labels
-        self._buttons: list[QPushButton] = []
+        self._buttons: list[QToolButton] = []
+        # pre-rendered label icons, swapped on selection instead of restyling, rendered
+        # on first show once the stylesheet font and the screen pixel ratio are known
+        self._icons: list[QIcon] = []
+        self._icons_selected: list[QIcon] = []
+        self._button_selected: list[bool] = []
+        self._button_group = QButtonGroup(self)
+        self._button_group.setExclusive(False)
         self._selected_index: int | None = None
-        self._highlight_widget = QWidget(self)
-        self._animation = QPropertyAnimation(self._highlight_widget, b"geometry")
+        # highlight and animation are created on first selection
+        self._highlight_widget: _HighlightWidget | None = None
+        self._last_highlight_rect: QRect | None = None
+        self._animation: QVariantAnimation | None = None
 
         self._setup_ui()
-        self._setup_highlight()
-        self._setup_animation()
 
     @property
-    def buttons(self) -> tuple[QPushButton, ...]:
+    def buttons(self) -> tuple[QToolButton, ...]:
         """Get read-only access to the buttons list.
 
         Returns
         -------
-        tuple of QPushButton
+        tuple of QToolButton
             The tuple of buttons in this group.
         """
         return tuple(self._buttons)
@@ -87,40 +240,150 @@ class AnimatedButtonGroup(QWidget):
         layout.addStretch()
 
         for i, label in enumerate(self._button_labels):
-            button = QPushButton(label)
+            button = QToolButton()
             button.setCheckable(False)
-            # Calculate button width based on text content with padding
-            button_width = max(GUIConfig.MODEL_BUTTON_SIZE[0], len(label) * 10 + 40)
-            button.setFixedSize(button_width, GUIConfig.MODEL_BUTTON_SIZE[1])
+            button.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonIconOnly)
+            button.setAutoRaise(True)  # use the icon 'Active' mode on hover
+            button.setAccessibleName(label)
+            button.setFixedSize(QSize(*GUIConfig.MODEL_BUTTON_SIZE))
+            # Static class (transparent background), the state is carried by the icon
             button.setProperty("class", "model-button")
-            button.clicked.connect(lambda _, idx=i: self._on_button_clicked(idx))
+            self._button_selected.append(False)
+
+            self._button_group.addButton(button, i)
             self._buttons.append(button)
             layout.addWidget(button)
 
         layout.addStretch()
+        # single dispatcher for all buttons, the group maps the sender to its index
+        self._button_group.idClicked.connect(self._on_button_clicked)
         self._apply_styles()
 
-    def _setup_highlight(self) -> None:
-        """Set up the highlight widget."""
+    def _render_labels(self) -> None:
+        """Render the label icons and size the buttons to fit their label."""
+        self.ensurePolished()  # resolve the stylesheet font
+        font = QFont(self.font())
+        font.setPixelSize(_LABEL_FONT_SIZE)
+        font.setWeight(QFont.Weight.Medium)
+        font_selected = QFont(font)
+        font_selected.setWeight(QFont.Weight.DemiBold)
+        font_metrics = QFontMetrics(font_selected)
+        dpr = self.devicePixelRatioF()
+        colors = GUIConfig.COLORS
+        self._icons.clear()
+        self._icons_selected.clear()
+        for label, button, is_selected in zip(
+            self._button_labels, self._buttons, self._button_selected, strict=True
+        ):
+            # Calculate button width based on the rendered text width with padding
+            size = QSize(
+                max(
+                    GUIConfig.MODEL_BUTTON_SIZE[0],
+                    font_metrics.horizontalAdvance(label) + 40,
+                ),
+                GUIConfig.MODEL_BUTTON_SIZE[1],
+            )
+            button.setFixedSize(size)
+            button.setIconSize(size)
+
+            icon = QIcon()
+            for mode, color in (
+                (QIcon.Mode.Normal, colors["text_secondary"]),
+                (QIcon.Mode.Active, colors["text_primary"]),
+                (QIcon.Mode.Disabled, colors["text_disabled"]),
+            ):
+                icon.addPixmap(_render_label(label, font, color, size, dpr), mode)
+            icon_selected = QIcon()
+            for mode, color in (
+                (QIcon.Mode.Normal, colors["highlight_text"]),
+                (QIcon.Mode.Active, colors["highlight_text"]),
+                (QIcon.Mode.Disabled, colors["text_disabled"]),
+            ):
+                icon_selected.addPixmap(
+                    _render_label(label, font_selected, color, size, dpr), mode
+                )
+            self._icons.append(icon)
+            self._icons_selected.append(icon_selected)
+            button.setIcon(icon_selected if is_selected else icon)
+
+        # the button sizes might have changed, move the highlight to the new geometry
+        self.layout().activate()
+        self._update_highlight_position()
+
+    def showEvent(self, event: QShowEvent) -> None:
+        """Handle show events and render the labels on first show.
+
+        Parameters
+        ----------
+        event : QShowEvent
+            The show event.
+        """
+        if len(self._icons) == 0:
+            self._render_labels()
+        super().showEvent(event)
+
+    def changeEvent(self, event: QEvent) -> None:
+        """Handle change events and render the labels again if needed.
+
+        Parameters
+        ----------
+        event : QEvent
+            The change event.
+        """
+        if len(self._icons) != 0 and event.type() in (
+            QEvent.Type.FontChange,
+            QEvent.Type.StyleChange,
+            *_DPR_CHANGE_EVENTS,
+        ):
+            self._render_labels()
+        super().changeEvent(event)
+
+    def _ensure_highlight(self) -> _HighlightWidget:
+        """Create the highlight widget and its animation if needed.
+
+        Returns
+        -------
+        _HighlightWidget
+            The highlight widget.
+        """
+        if self._highlight_widget is not None:
+            return self._highlight_widget
+        self._highlight_widget = _HighlightWidget(self)
         self._highlight_widget.setAttribute(
             Qt.WidgetAttribute.WA_TransparentForMouseEvents
         )
         self._highlight_widget.lower()
-        self._update_highlight_position()
+        apply_css_class(self._highlight_widget, "highlight")
 
-    def _setup_animation(self) -> None:
-        """Set up the animation properties."""
+        self._animation = QVariantAnimation(self)
         self._animation.setDuration(GUIConfig.ANIMATION_DURATION)
         self._animation.setEasingCurve(GUIConfig.ANIMATION_EASING)
+        self._animation.valueChanged.connect(self._on_animation_value_changed)
+        return self._highlight_widget
+
+    def _on_animation_value_changed(self, x: int) -> None:
+        """Move the highlight horizontally to the interpolated position.
+
+        Parameters
+        ----------
+        x : int
+            The interpolated x-coordinate of the highlight.
+        """
+        self._highlight_widget.move(x, self._highlight_widget.y())
 
     def _update_highlight_position(self) -> None:
         """Update highlight position to match selected button."""
         if self._buttons and self._selected_index is not None:
-            button = self._buttons[self._selected_index]
-            self._highlight_widget.setGeometry(button.geometry())
-            self._highlight_widget.show()
-        elif self._selected_index is None:
+            target = self._buttons[self._selected_index].geometry()
+            if target == self._last_highlight_rect:
+                return
+            highlight_widget = self._ensure_highlight()
+            highlight_widget.setGeometry(target)
+            highlight_widget.show()
+            self._last_highlight_rect = target
+        elif self._selected_index is None and self._highlight_widget is not None:
             self._highlight_widget.hide()
+            self._last_highlight_rect = None
 
     def _on_button_clicked(self, index: int) -> None:
         """Handle button click and animate to new selection.
@@ -139,29 +402,36 @@ class AnimatedButtonGroup(QWidget):
 
         # Animate highlight if we had a previous selection
         if old_index is not None:
-            start_rect = self._buttons[old_index].geometry()
+            # Only the x-coordinate is animated, the buttons share the same row
+            highlight_widget = self._ensure_highlight()
             end_rect = self._buttons[index].geometry()
-            self._animation.setStartValue(start_rect)
-            self._animation.setEndValue(end_rect)
-            self._animation.start()
+            if not (
+                self._animation.state() == QAbstractAnimation.State.Running
+                and self._animation.endValue() == end_rect.x()
+            ):
+                # Start from the current position, i.e. the previous button or the
+                # position reached by an interrupted animation
+                highlight_widget.resize(end_rect.size())
+                self._animation.setStartValue(highlight_widget.x())
+                self._animation.setEndValue(end_rect.x())
+                self._animation.start()
+                self._last_highlight_rect = end_rect
         else:
             self._update_highlight_position()
-            self._highlight_widget.show()
 
         self.selectionChanged.emit(self._button_labels[index])
 
     def _apply_styles(self) -> None:
-        """Apply current styles to all components."""
+        """Swap the label icons of the buttons whose selection state changed."""
         for k, button in enumerate(self._buttons):
-            is_selected = self._selected_index is not None and k == self._selected_index
-            button.setProperty(
-                "class",
-                "model-button-selected" if is_selected else "model-button",
-            )
-            button.style().unpolish(button)
-            button.style().polish(button)
-
-        apply_css_class(self._highlight_widget, "highlight")
+            is_selected = k == self._selected_index
+            if is_selected == self._button_selected[k]:
+                continue
+            self._button_selected[k] = is_selected
+            if len(self._icons) != 0:  # labels are rendered on first show
+                button.setIcon(
+                    self._icons_selected[k] if is_selected else self._icons[k]
+                )
 
     def resizeEvent(self, event: QResizeEvent) -> None:
         """Handle resize events and update highlight position.
@@ -204,9 +474,11 @@ class AnimatedButtonGroup(QWidget):
         """
         try:
             index = self._button_labels.index(label)
-            self.set_selected_index(index)
         except ValueError:
             raise ValueError(f"Label '{label}' not found in button labels")
+        if index == self._selected_index:
+            return
+        self.set_selected_index(index)
 
     def clear_selection(self) -> None:
         """Clear the current selection (no button selected)."""
@@ -3,13 +3,16 @@
 from __future__ import annotations
 
 import os
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
-from PyQt6.QtCore import QSignalBlocker, Qt, pyqtSignal
+from PyQt6.QtCore import QSignalBlocker, Qt, QTimer, pyqtSignal
 from PyQt6.QtWidgets import QHBoxLayout, QLabel, QLineEdit, QWidget
 
 from ..utils import GUIConfig, set_validation_icon
 
+if TYPE_CHECKING:
+    from PyQt6.QtGui import QPixmap
+
 
 class APIKeyWidget(QWidget):
     """Widget for API key input with source indicator and validation.
@@ -29,11 +32,21 @@ class APIKeyWidget(QWidget):
     apiKeyChanged = pyqtSignal(str)
     validationChanged = pyqtSignal(bool)
 
+    # source indicator pixmaps, rasterized once and shared by all instances
+    _ICON_CACHE: dict[tuple[str, int], QPixmap] = {}
+
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self._source: Literal["env", "manual", "empty"] = "empty"
         self._current_model: Literal["gemini", "claude"] | None = None
         self._is_valid = False
+        self._last_raw = ""
+        self._env_cache: dict[str, str] = {}
+        # debounce validation while the user is typing
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(150)
+        self._validate_timer.timeout.connect(self._validate_and_emit)
 
         self._setup_ui()
         self._connect_signals()
@@ -86,15 +99,23 @@ class APIKeyWidget(QWidget):
             self._source = "manual"
             self._update_source_icon()
 
+        self._validate_timer.start()
+
+    def _validate_and_emit(self) -> None:
+        """Validate the API key and emit the change once typing paused."""
         self._validate()
-        self.apiKeyChanged.emit(text)
+        self.apiKeyChanged.emit(self._input.text())
 
     def _validate(self) -> None:
         """Validate the API key and update icons."""
-        text = self._input.text().strip()
+        raw = self._input.text()
+        if raw == self._last_raw:
+            return
+        self._last_raw = raw
         was_valid = self._is_valid
 
-        if text:
+        # short-circuit avoids the strip allocation on an empty field
+        if raw and raw.strip():
             self._is_valid = True
             if self._source == "empty":
                 self._source = "manual"
@@ -104,6 +125,16 @@ class APIKeyWidget(QWidget):
             self._source = "empty"
             self._update_source_icon()
 
+        self._update_validation_icon(was_valid)
+
+    def _update_validation_icon(self, was_valid: bool) -> None:
+        """Update the validation icon and notify validity transitions.
+
+        Parameters
+        ----------
+        was_valid : bool
+            The validity before the current update.
+        """
         set_validation_icon(self._validation_icon, self._is_valid)
 
         if was_valid != self._is_valid:
@@ -111,9 +142,14 @@ class APIKeyWidget(QWidget):
 
     def _update_source_icon(self) -> None:
         """Update the source indicator icon."""
-        icon = GUIConfig.get_api_key_source_icon(self._source)
         size = GUIConfig.API_KEY_INDICATOR_SIZE[0]
-        self._source_icon.setPixmap(icon.pixmap(size, size))
+        key = (self._source, size)
+        pixmap = self._ICON_CACHE.get(key)
+        if pixmap is None:
+            icon = GUIConfig.get_api_key_source_icon(self._source)
+            pixmap = icon.pixmap(size, size)
+            self._ICON_CACHE[key] = pixmap
+        self._source_icon.setPixmap(pixmap)
 
         # Set tooltip based on source
         if self._source == "env":
@@ -153,25 +189,32 @@ class APIKeyWidget(QWidget):
         """
         self._current_model = model.lower()
 
-        # Try to load from environment variable
-        env_var = self._get_env_var_name()
-        env_value = os.environ.get(env_var, "")
+        # Try to load from environment variable, looked up once per model
+        env_value = self._env_cache.get(self._current_model)
+        if env_value is None:
+            env_value = os.environ.get(self._get_env_var_name(), "")
+            self._env_cache[self._current_model] = env_value
 
         if env_value:
-            self._source = "env"
+            if self._source == "env" and env_value == self._input.text():
+                return
             # Block signals to avoid triggering validation twice
             with QSignalBlocker(self._input):
                 self._input.setText(env_value)
-            self._update_source_icon()
-            self._validate()
+        elif self._source == "env":
+            # Clear the field if it was loaded from a different env, and keep the
+            # current manual entry otherwise
+            self._input.clear()
         else:
-            # Clear the field if no env var and keep current manual entry
-            # or clear if it was from a different env
-            if self._source == "env":
-                self._input.clear()
-                self._source = "empty"
-                self._update_source_icon()
-                self._validate()
+            return
+
+        # Single state transition: source icon and validation are updated once
+        was_valid = self._is_valid
+        self._last_raw = self._input.text()
+        self._is_valid = bool(env_value.strip())
+        self._source = "env" if self._is_valid else "empty"
+        self._update_source_icon()
+        self._update_validation_icon(was_valid)
 
     def get_api_key(self) -> str:
         """Get the current API key value.
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtCore import QTimer, pyqtSignal, pyqtSlot
 from PyQt6.QtWidgets import (
     QDoubleSpinBox,
     QGridLayout,
@@ -31,6 +31,12 @@ class GenerationParametersWidget(QWidget):
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
+        # coalesce bursts of parameter changes into a single emission
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(16)
+        self._emit_timer.timeout.connect(self._flush_parameters_changed)
+
         self._setup_ui()
         self._connect_signals()
 
@@ -91,42 +97,69 @@ class GenerationParametersWidget(QWidget):
         layout.addWidget(self._max_tokens, 3, 1)
 
         # Apply initial toggle states
-        self._on_temperature_toggle_changed(False)
-        self._on_top_p_toggle_changed(True)
-        self._on_top_k_toggle_changed(True)
+        for toggle, label, spinbox in (
+            (
+                self._temperature_default_toggle,
+                self._temperature_label,
+                self._temperature,
+            ),
+            (self._top_p_default_toggle, self._top_p_label, self._top_p),
+            (self._top_k_default_toggle, self._top_k_label, self._top_k),
+        ):
+            label.setEnabled(not toggle.isChecked())
+            spinbox.setEnabled(not toggle.isChecked())
+        # Initial parameters, compared against to emit parametersChanged
+        self._last_params: dict = self.get_parameters()
 
     def _connect_signals(self) -> None:
         """Connect internal signals."""
-        self._temperature.valueChanged.connect(self._on_parameter_changed)
-        self._top_p.valueChanged.connect(self._on_parameter_changed)
-        self._top_k.valueChanged.connect(self._on_parameter_changed)
-        self._max_tokens.valueChanged.connect(self._on_parameter_changed)
+        # Parameters are only read on demand, notify once the user commits a value
+        self._temperature.editingFinished.connect(self._on_parameter_changed)
+        self._top_p.editingFinished.connect(self._on_parameter_changed)
+        self._top_k.editingFinished.connect(self._on_parameter_changed)
+        self._max_tokens.editingFinished.connect(self._on_parameter_changed)
         self._temperature_default_toggle.toggled.connect(
             self._on_temperature_toggle_changed
         )
         self._top_p_default_toggle.toggled.connect(self._on_top_p_toggle_changed)
         self._top_k_default_toggle.toggled.connect(self._on_top_k_toggle_changed)
 
+    @pyqtSlot(bool)
     def _on_temperature_toggle_changed(self, use_default: bool) -> None:
         """Handle temperature API default toggle change."""
         self._temperature_label.setEnabled(not use_default)
         self._temperature.setEnabled(not use_default)
         self._on_parameter_changed()
 
+    @pyqtSlot(bool)
     def _on_top_p_toggle_changed(self, use_default: bool) -> None:
         """Handle top_p API default toggle change."""
         self._top_p_label.setEnabled(not use_default)
         self._top_p.setEnabled(not use_default)
         self._on_parameter_changed()
 
+    @pyqtSlot(bool)
     def _on_top_k_toggle_changed(self, use_default: bool) -> None:
         """Handle top_k API default toggle change."""
         self._top_k_label.setEnabled(not use_default)
         self._top_k.setEnabled(not use_default)
         self._on_parameter_changed()
 
+    @pyqtSlot()
     def _on_parameter_changed(self) -> None:
-        """Handle parameter value changes."""
+        """Handle parameter value changes.
+
+        The emission of ``parametersChanged`` is deferred and coalesced, i.e. a burst
+        of changes (e.g. holding a spinbox arrow) emits a single signal.
+        """
+        self._emit_timer.start()
+
+    def _flush_parameters_changed(self) -> None:
+        """Emit ``parametersChanged`` if the parameters changed since the last one."""
+        params = self.get_parameters()
+        if params == self._last_params:
+            return
+        self._last_params = params
         self.parametersChanged.emit()
 
     def get_temperature(self) -> float | None:
@@ -4,8 +4,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from PyQt6.QtCore import QRect, QSize, Qt
-from PyQt6.QtGui import QColor, QPainter, QTextFormat
+from PyQt6.QtCore import QEvent, QRect, QSize, Qt, QTimer
+from PyQt6.QtGui import QColor, QPainter, QPixmap, QRegion, QTextFormat
 from PyQt6.QtWidgets import QPlainTextEdit, QTextEdit, QWidget
 
 from ..utils import GUIConfig
@@ -26,6 +26,9 @@ class LineNumberArea(QWidget):
     def __init__(self, editor: LineNumberTextEdit) -> None:
         super().__init__(editor)
         self._editor = editor
+        # rendered gutter, re-used until the key describing its content changes
+        self._cache_pixmap: QPixmap | None = None
+        self._cache_key: tuple | None = None
 
     def sizeHint(self) -> QSize:
         """Get the recommended size for this widget.
@@ -45,7 +48,37 @@ class LineNumberArea(QWidget):
         event : QPaintEvent
             The paint event.
         """
-        self._editor.line_number_area_paint_event(event)
+        if self.width() <= 0 or self.height() <= 0:
+            return
+        editor = self._editor
+        dpr = self.devicePixelRatioF()
+        key = (
+            editor.firstVisibleBlock().blockNumber(),
+            editor.contentOffset().y(),
+            editor.blockCount(),
+            editor.document().revision(),
+            self.width(),
+            self.height(),
+            dpr,
+            editor.font().key(),
+            # wrapped lines move when the wrap width changes without any edit
+            editor.lineWrapMode(),
+            editor.viewport().width(),
+        )
+        if self._cache_pixmap is None or key != self._cache_key:
+            pixmap = QPixmap(
+                QSize(round(self.width() * dpr), round(self.height() * dpr))
+            )
+            pixmap.setDevicePixelRatio(dpr)
+            painter = QPainter(pixmap)
+            editor.line_number_area_paint(painter, self.rect())
+            painter.end()
+            self._cache_pixmap = pixmap
+            self._cache_key = key
+
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._cache_pixmap)
+        painter.end()
 
 
 class LineNumberTextEdit(QPlainTextEdit):
@@ -63,10 +96,27 @@ class LineNumberTextEdit(QPlainTextEdit):
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
+        self._color_bg = QColor(GUIConfig.COLORS["bg_tertiary"])
+        self._color_line = QColor(GUIConfig.COLORS["text_muted"])
         self._line_number_area = LineNumberArea(self)
+        # cached gutter width, invalidated on block count and font changes
+        self._cached_lna_width: int | None = None
+        # line number strings, indexed by block number and grown with the document
+        self._line_str_cache: list[str] = ["1"]
+        # block of the current line highlight, re-applied only when it changes
+        self._last_highlight_block = -1
+        self._force_highlight = False
+        # last read-only state applied through setReadOnly
+        self._last_read_only: bool | None = None
+        # gutter regions to repaint, merged and flushed on the next event loop turn
+        self._pending_region = QRegion()
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(0)
+        self._flush_timer.timeout.connect(self._flush_line_number_area_updates)
 
         # Connect signals for updating line number area
-        self.blockCountChanged.connect(self._update_line_number_area_width)
+        self.blockCountChanged.connect(self._on_block_count_changed)
         self.updateRequest.connect(self._update_line_number_area)
         self.cursorPositionChanged.connect(self._highlight_current_line)
 
@@ -90,17 +140,28 @@ class LineNumberTextEdit(QPlainTextEdit):
         int
             The width in pixels.
         """
-        digits = 1
-        max_num = max(1, self.blockCount())
-        while max_num >= 10:
-            max_num //= 10
-            digits += 1
-
+        if self._cached_lna_width is not None:
+            return self._cached_lna_width
         # Ensure minimum width for 3 digits plus padding
-        digits = max(3, digits)
+        digits = max(3, len(str(max(1, self.blockCount()))))
         space = 10 + self.fontMetrics().horizontalAdvance("9") * digits
+        self._cached_lna_width = space
         return space
 
+    def _on_block_count_changed(self, block_count: int) -> None:
+        """Invalidate the cached gutter width and update the viewport margins.
+
+        Parameters
+        ----------
+        block_count : int
+            The new block count.
+        """
+        self._cached_lna_width = None
+        cache = self._line_str_cache
+        while len(cache) < block_count:
+            cache.append(str(len(cache) + 1))
+        self._update_line_number_area_width(block_count)
+
     def _update_line_number_area_width(self, _: int) -> None:
         """Update the viewport margins to accommodate line number area.
 
@@ -124,13 +185,32 @@ class LineNumberTextEdit(QPlainTextEdit):
         if dy:
             self._line_number_area.scroll(0, dy)
         else:
-            self._line_number_area.update(
+            self._pending_region += QRect(
                 0, rect.y(), self._line_number_area.width(), rect.height()
             )
+            self._flush_timer.start()
 
         if rect.contains(self.viewport().rect()):
             self._update_line_number_area_width(0)
 
+    def _flush_line_number_area_updates(self) -> None:
+        """Repaint the accumulated regions of the line number area at once."""
+        if not self._pending_region.isEmpty():
+            self._line_number_area.update(self._pending_region)
+            self._pending_region = QRegion()
+
+    def changeEvent(self, event: QEvent) -> None:
+        """Handle change events and refresh the gutter width on font changes.
+
+        Parameters
+        ----------
+        event : QEvent
+            The change event.
+        """
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.FontChange:
+            self._on_block_count_changed(self.blockCount())
+
     def resizeEvent(self, event: QResizeEvent) -> None:
         """Handle resize events.
 
@@ -147,12 +227,16 @@ class LineNumberTextEdit(QPlainTextEdit):
 
     def _highlight_current_line(self) -> None:
         """Highlight the current line."""
+        block_number = self.textCursor().blockNumber()
+        if block_number == self._last_highlight_block and not self._force_highlight:
+            return
+        self._last_highlight_block = block_number
+        self._force_highlight = False
         extra_selections = []
 
         if not self.isReadOnly():
             selection = QTextEdit.ExtraSelection()
-            line_color = QColor(GUIConfig.COLORS["bg_tertiary"])
-            selection.format.setBackground(line_color)
+            selection.format.setBackground(self._color_bg)
             selection.format.setProperty(QTextFormat.Property.FullWidthSelection, True)
             selection.cursor = self.textCursor()
             selection.cursor.clearSelection()
@@ -160,18 +244,18 @@ class LineNumberTextEdit(QPlainTextEdit):
 
         self.setExtraSelections(extra_selections)
 
-    def line_number_area_paint_event(self, event: QPaintEvent) -> None:
-        """Paint the line number area.
+    def line_number_area_paint(self, painter: QPainter, rect: QRect) -> None:
+        """Paint the line numbers intersecting a region of the line number area.
 
         Parameters
         ----------
-        event : QPaintEvent
-            The paint event.
+        painter : QPainter
+            The active painter, targeting the line number area or its cache.
+        rect : QRect
+            The region of the line number area to paint.
         """
-        painter = QPainter(self._line_number_area)
-
         # Background
-        painter.fillRect(event.rect(), QColor(GUIConfig.COLORS["bg_tertiary"]))
+        painter.fillRect(rect, self._color_bg)
 
         # Draw line numbers
         block = self.firstVisibleBlock()
@@ -182,27 +266,36 @@ class LineNumberTextEdit(QPlainTextEdit):
         bottom = top + round(self.blockBoundingRect(block).height())
 
         # Line number text color
-        painter.setPen(QColor(GUIConfig.COLORS["text_muted"]))
+        painter.setPen(self._color_line)
+
+        # Hoist loop invariants out of the per-line loop
+        line_strs = self._line_str_cache
+        fm_height = self.fontMetrics().height()
+        text_width = self._line_number_area.width() - 5
+        align = Qt.AlignmentFlag.AlignRight
+        rect_top = rect.top()
+        rect_bottom = rect.bottom()
+        # Without wrapping, every block spans a single line of the same height
+        line_height = (
+            bottom - top
+            if self.lineWrapMode() == QPlainTextEdit.LineWrapMode.NoWrap
+            else None
+        )
 
-        while block.isValid() and top <= event.rect().bottom():
-            if block.isVisible() and bottom >= event.rect().top():
-                number = str(block_number + 1)
+        while block.isValid() and top <= rect_bottom:
+            if block.isVisible() and bottom >= rect_top:
                 painter.drawText(
-                    0,
-                    top,
-                    self._line_number_area.width() - 5,
-                    self.fontMetrics().height(),
-                    Qt.AlignmentFlag.AlignRight,
-                    number,
+                    0, top, text_width, fm_height, align, line_strs[block_number]
                 )
 
             block = block.next()
             top = bottom
-            bottom = top + round(self.blockBoundingRect(block).height())
+            if line_height is None:
+                bottom = top + round(self.blockBoundingRect(block).height())
+            else:
+                bottom = top + line_height
             block_number += 1
 
-        painter.end()
-
     def setReadOnly(self, read_only: bool) -> None:
         """Set the read-only state.
 
@@ -211,7 +304,11 @@ class LineNumberTextEdit(QPlainTextEdit):
         read_only : bool
             Whether the editor should be read-only.
         """
+        if read_only == self._last_read_only:
+            return
+        self._last_read_only = read_only
         super().setReadOnly(read_only)
+        self._force_highlight = True
         self._highlight_current_line()
 
         # Update styling for read-only mode
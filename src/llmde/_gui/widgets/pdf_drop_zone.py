@@ -2,10 +2,19 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from PyQt6.QtCore import QEvent, QObject, Qt, pyqtSignal
+from PyQt6.QtCore import (
+    QEvent,
+    QObject,
+    QRunnable,
+    QSize,
+    Qt,
+    QThreadPool,
+    pyqtSignal,
+)
 from PyQt6.QtWidgets import (
     QFileDialog,
     QHBoxLayout,
@@ -17,10 +26,134 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from ...utils.logs import warn
 from ..utils import apply_css_class
 
 if TYPE_CHECKING:
-    from PyQt6.QtGui import QDragEnterEvent, QDragLeaveEvent, QDropEvent
+    from collections.abc import Iterable
+
+    from PyQt6.QtCore import QUrl
+    from PyQt6.QtGui import (
+        QDragEnterEvent,
+        QDragLeaveEvent,
+        QDragMoveEvent,
+        QDropEvent,
+        QResizeEvent,
+    )
+
+# number of file item widgets created at once, a few times the visible row count
+_ROW_BATCH: int = 20
+
+
+def _local_pdf_path(url: QUrl) -> str | None:
+    """Get the local path pointed to by an URL if it is a PDF file.
+
+    Parameters
+    ----------
+    url : QUrl
+        The URL to check.
+
+    Returns
+    -------
+    str | None
+        The normalized local file path, or None if the URL is not a local PDF file.
+    """
+    if not url.isLocalFile():
+        return None
+    file_path = url.toLocalFile()
+    # lowercase only the suffix instead of a copy of the full path
+    return os.path.normpath(file_path) if file_path[-4:].lower() == ".pdf" else None
+
+
+class _PDFCheckSignals(QObject):
+    """Signals emitted by :class:`_PDFCheckTask` from the worker threads."""
+
+    finished = pyqtSignal(str, bool)  # (file_path, is_pdf)
+
+
+class _PDFCheckTask(QRunnable):
+    """Task checking the magic bytes of a file in a worker thread.
+
+    Parameters
+    ----------
+    file_path : str
+        The path to the file to check.
+    signals : _PDFCheckSignals
+        The signals used to report the result, owned by the GUI thread.
+    """
+
+    def __init__(self, file_path: str, signals: _PDFCheckSignals) -> None:
+        super().__init__()
+        self._file_path = file_path
+        self._signals = signals
+
+    def run(self) -> None:
+        """Look for the PDF header in the first KiB of the file."""
+        try:
+            with open(self._file_path, "rb") as fid:
+                is_pdf = b"%PDF" in fid.read(1024)
+        except OSError:
+            is_pdf = False
+        self._signals.finished.emit(self._file_path, is_pdf)
+
+
+class _ElidedLabel(QLabel):
+    """Label eliding its text in the middle to fit its width.
+
+    Parameters
+    ----------
+    text : str
+        The full text, elided again whenever the label is resized.
+    """
+
+    def __init__(self, text: str) -> None:
+        super().__init__(text)
+        self._full_text = text
+
+    def sizeHint(self) -> QSize:
+        """Get the size hint of the full text, independent of the elision.
+
+        Returns
+        -------
+        QSize
+            The recommended size of the label.
+        """
+        hint = super().sizeHint()
+        margins = self.contentsMargins()
+        width = self.fontMetrics().horizontalAdvance(self._full_text)
+        return QSize(width + margins.left() + margins.right(), hint.height())
+
+    def resizeEvent(self, event: QResizeEvent) -> None:
+        """Handle resize events and elide the text to the new width.
+
+        Parameters
+        ----------
+        event : QResizeEvent
+            The resize event.
+        """
+        super().resizeEvent(event)
+        self._elide()
+
+    def changeEvent(self, event: QEvent) -> None:
+        """Handle change events and elide the text again on font changes.
+
+        Parameters
+        ----------
+        event : QEvent
+            The change event.
+        """
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.FontChange:
+            self.updateGeometry()
+            self._elide()
+
+    def _elide(self) -> None:
+        """Elide the full text to the width of the label contents."""
+        text = self.fontMetrics().elidedText(
+            self._full_text, Qt.TextElideMode.ElideMiddle, self.contentsRect().width()
+        )
+        if text != self.text():
+            self.setText(text)
 
 
 class PDFDropZone(QWidget):
@@ -33,7 +166,8 @@ class PDFDropZone(QWidget):
 
     Notes
     -----
-    Accepts only PDF files. Displays dropped files in a list with remove buttons.
+    Accepts only PDF files, checked by their header in a background thread before
+    they are added. Displays dropped files in a list with remove buttons.
     Emits filesChanged signal when files are added or removed.
     """
 
@@ -42,6 +176,20 @@ class PDFDropZone(QWidget):
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self._files: list[str] = []
+        # companion set of self._files for constant-time membership checks
+        self._files_set: set[str] = set()
+        # file item widgets, keyed by file path, updated incrementally. Widgets exist
+        # only for a prefix of self._files, extended as the list is scrolled.
+        self._item_widgets: dict[str, QWidget] = {}
+        # Path objects of self._files, built on demand and reset on every change
+        self._files_paths_cache: list[Path] | None = None
+        # files being checked, in request order, mapped to their result once known
+        self._pending_files: dict[str, bool | None] = {}
+        # names of the files rejected by the last check, shown in the info label
+        self._rejected_files: list[str] = []
+        self._thread_pool = QThreadPool(self)
+        self._check_signals = _PDFCheckSignals(self)
+        self._check_signals.finished.connect(self._on_file_checked)
         self._drag_active = False
 
         self._setup_ui()
@@ -73,14 +221,24 @@ class PDFDropZone(QWidget):
         self._file_list_container.setSizePolicy(
             QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred
         )
-        file_list_layout = QVBoxLayout(self._file_list_container)
-        file_list_layout.setContentsMargins(0, 0, 0, 0)
-        file_list_layout.setSpacing(4)
+        self._file_list_layout = QVBoxLayout(self._file_list_container)
+        self._file_list_layout.setContentsMargins(0, 0, 0, 0)
+        self._file_list_layout.setSpacing(4)
 
         # Info label
         self._info_label = QLabel("No files selected")
         self._info_label.setProperty("class", "status-text")
-        file_list_layout.addWidget(self._info_label)
+        self._file_list_layout.addWidget(self._info_label)
+        # Placeholder for the scroll area, built when the first file is added
+        self._file_list_layout.addStretch(1)
+        self._file_scroll_area: QScrollArea | None = None
+
+        main_layout.addWidget(self._file_list_container, 1)
+
+    def _ensure_file_list_built(self) -> None:
+        """Build the scroll area holding the file items if it does not exist yet."""
+        if self._file_scroll_area is not None:
+            return
 
         # Scroll area for file items
         self._file_scroll_area = QScrollArea()
@@ -102,9 +260,26 @@ class PDFDropZone(QWidget):
         self._file_items_layout.addStretch()
 
         self._file_scroll_area.setWidget(self._file_items_widget)
-        file_list_layout.addWidget(self._file_scroll_area, 1)
+        self._file_scroll_area.verticalScrollBar().valueChanged.connect(
+            self._on_file_list_scrolled
+        )
+        # Replace the placeholder stretch with the scroll area
+        self._file_list_layout.takeAt(1)
+        self._file_list_layout.addWidget(self._file_scroll_area, 1)
 
-        main_layout.addWidget(self._file_list_container, 1)
+    def _set_drag_active(self, active: bool) -> None:
+        """Set the drag state and refresh the drop zone if it changed.
+
+        Parameters
+        ----------
+        active : bool
+            Whether a valid drag is hovering the widget.
+        """
+        if active == self._drag_active:
+            return
+        self._drag_active = active
+        self._update_drop_zone_text()
+        self._apply_drop_zone_style()
 
     def _update_drop_zone_text(self) -> None:
         """Update the drop zone text based on current state."""
@@ -151,12 +326,8 @@ class PDFDropZone(QWidget):
             "PDF Files (*.pdf);;All Files (*)",
         )
 
-        if files:
-            new_files = [f for f in files if f not in self._files]
-            if new_files:
-                self._files.extend(new_files)
-                self._update_file_list()
-                self.filesChanged.emit()
+        # Normalize the paths so that different spellings of a file are deduplicated
+        self._check_files(os.path.normpath(f) for f in files)
 
     def dragEnterEvent(self, event: QDragEnterEvent) -> None:
         """Handle drag enter events.
@@ -167,24 +338,27 @@ class PDFDropZone(QWidget):
             The drag enter event.
         """
         if event.mimeData().hasUrls():
-            # Check if any files are PDFs
-            valid_files = []
-            for url in event.mimeData().urls():
-                if url.isLocalFile():
-                    file_path = url.toLocalFile()
-                    if file_path.lower().endswith(".pdf"):
-                        valid_files.append(file_path)
-
-            if valid_files:
+            # Accept as soon as one of the URLs is a PDF file
+            if any(_local_pdf_path(url) for url in event.mimeData().urls()):
                 event.acceptProposedAction()
-                self._drag_active = True
-                self._update_drop_zone_text()
-                self._apply_drop_zone_style()
+                self._set_drag_active(True)
             else:
                 event.ignore()
         else:
             event.ignore()
 
+    def dragMoveEvent(self, event: QDragMoveEvent) -> None:
+        """Handle drag move events.
+
+        Parameters
+        ----------
+        event : QDragMoveEvent
+            The drag move event.
+        """
+        # The drag was validated on enter, accepting the whole widget rectangle
+        # stops further move events until the cursor leaves it.
+        event.accept(self.rect())
+
     def dragLeaveEvent(self, event: QDragLeaveEvent) -> None:
         """Handle drag leave events.
 
@@ -193,9 +367,7 @@ class PDFDropZone(QWidget):
         event : QDragLeaveEvent
             The drag leave event.
         """
-        self._drag_active = False
-        self._update_drop_zone_text()
-        self._apply_drop_zone_style()
+        self._set_drag_active(False)
         super().dragLeaveEvent(event)
 
     def dropEvent(self, event: QDropEvent) -> None:
@@ -207,50 +379,157 @@ class PDFDropZone(QWidget):
             The drop event.
         """
         if event.mimeData().hasUrls():
-            new_files = []
-            for url in event.mimeData().urls():
-                if url.isLocalFile():
-                    file_path = url.toLocalFile()
-                    if file_path.lower().endswith(".pdf"):
-                        if file_path not in self._files:
-                            new_files.append(file_path)
-
-            if new_files:
-                self._files.extend(new_files)
-                self._update_file_list()
-                self.filesChanged.emit()
+            # Filter, deduplicate and queue in a single pass, preserving the drop order
+            file_paths = (
+                file_path
+                for url in event.mimeData().urls()
+                if (file_path := _local_pdf_path(url)) is not None
+            )
+            if self._check_files(file_paths):
                 event.acceptProposedAction()
             else:
                 event.ignore()
         else:
             event.ignore()
 
-        self._drag_active = False
-        self._update_drop_zone_text()
-        self._apply_drop_zone_style()
+        self._set_drag_active(False)
+
+    def _check_files(self, file_paths: Iterable[str]) -> bool:
+        """Queue files for a PDF header check before adding them to the selection.
+
+        Parameters
+        ----------
+        file_paths : Iterable of str
+            The paths to check. Paths already selected or queued are skipped.
+
+        Returns
+        -------
+        bool
+            True if at least one file was queued, False otherwise.
+        """
+        queued = False
+        for file_path in file_paths:
+            if file_path in self._files_set or file_path in self._pending_files:
+                continue
+            self._pending_files[file_path] = None
+            self._thread_pool.start(_PDFCheckTask(file_path, self._check_signals))
+            queued = True
+        if queued:
+            self._rejected_files.clear()
+            self._update_info_label()
+        return queued
+
+    def _on_file_checked(self, file_path: str, is_pdf: bool) -> None:
+        """Add the checked files to the selection, in the order they were queued.
+
+        Parameters
+        ----------
+        file_path : str
+            The path to the checked file.
+        is_pdf : bool
+            Whether the file starts with a PDF header.
+        """
+        if file_path not in self._pending_files:
+            return  # selection cleared while the file was being checked
+        self._pending_files[file_path] = is_pdf
+        resolved = []
+        for pending_path, pending_is_pdf in self._pending_files.items():
+            if pending_is_pdf is None:
+                break
+            resolved.append(pending_path)
+        new_files = []
+        for f in resolved:
+            if self._pending_files.pop(f):
+                if f not in self._files_set:
+                    new_files.append(f)
+            else:
+                warn(f"The file '{f}' is not a valid PDF file and was skipped.")
+                self._rejected_files.append(Path(f).name)
+        if new_files:
+            self._add_files(new_files)
+        else:
+            self._update_info_label()
+
+    def _add_files(self, new_files: list[str]) -> None:
+        """Append files to the selection and create their item widgets.
+
+        Parameters
+        ----------
+        new_files : list of str
+            The paths to add, which must not already be selected.
+        """
+        self._files.extend(new_files)
+        self._files_set.update(new_files)
+        self._files_paths_cache = None
+        self._ensure_file_list_built()
+        self._materialize_rows(max(len(self._item_widgets), _ROW_BATCH))
+        # new rows are appended at the end, show them if the list is scrolled there
+        self._on_file_list_scrolled(self._file_scroll_area.verticalScrollBar().value())
+        self._update_info_label()
+        self.filesChanged.emit()
 
     def _update_file_list(self) -> None:
-        """Update the file list display."""
+        """Rebuild the file list display."""
         self._clear_file_items()
+        self._materialize_rows(_ROW_BATCH)
+        self._update_info_label()
 
-        if not self._files:
-            self._info_label.setText("No files selected")
+    def _materialize_rows(self, count: int) -> None:
+        """Create the item widgets of the first files, up to a given count.
+
+        Parameters
+        ----------
+        count : int
+            The number of rows that should exist, capped to the number of files.
+        """
+        new_rows = self._files[len(self._item_widgets) : count]
+        if not new_rows:
             return
+        self._ensure_file_list_built()
+        # Suspend repaints while the rows are inserted, to lay them out in one pass
+        self._file_items_widget.setUpdatesEnabled(False)
+        try:
+            for file_path in new_rows:
+                self._create_file_item_widget(file_path)
+        finally:
+            self._file_items_widget.setUpdatesEnabled(True)
+
+    def _on_file_list_scrolled(self, value: int) -> None:
+        """Create the next batch of rows when the list is scrolled near its end.
 
-        for file_path in self._files:
-            self._create_file_item_widget(file_path)
+        Parameters
+        ----------
+        value : int
+            The position of the vertical scroll bar.
+        """
+        if len(self._item_widgets) == len(self._files):
+            return
+        scroll_bar = self._file_scroll_area.verticalScrollBar()
+        if scroll_bar.maximum() - scroll_bar.pageStep() <= value:
+            self._materialize_rows(len(self._item_widgets) + _ROW_BATCH)
 
+    def _update_info_label(self) -> None:
+        """Update the info label with the number of selected and skipped files."""
         file_count = len(self._files)
-        self._info_label.setText(
-            f"{file_count} PDF file{'s' if file_count != 1 else ''} selected"
-        )
+        if file_count == 0:
+            text = "No files selected"
+        else:
+            text = f"{file_count} PDF file{'s' if file_count != 1 else ''} selected"
+        if self._pending_files:
+            text += f" (checking {len(self._pending_files)})"
+        if self._rejected_files:
+            text += f", skipped invalid PDF: {', '.join(self._rejected_files)}"
+        self._info_label.setText(text)
 
     def _clear_file_items(self) -> None:
         """Clear all file item widgets from the layout."""
+        if self._file_scroll_area is None:
+            return
         while self._file_items_layout.count() > 1:
             child = self._file_items_layout.takeAt(0)
             if child.widget():
                 child.widget().deleteLater()
+        self._item_widgets.clear()
 
     def _create_file_item_widget(self, file_path: str) -> None:
         """Create a file item widget with remove button.
@@ -260,41 +539,42 @@ class PDFDropZone(QWidget):
         file_path : str
             The full path to the file.
         """
+        self._ensure_file_list_built()
+        # New widgets are polished when first shown, setting the class property is
+        # enough and avoids re-resolving the stylesheet for every row.
         file_widget = QWidget()
-        apply_css_class(file_widget, "file-item")
+        file_widget.setProperty("class", "file-item")
         file_layout = QHBoxLayout(file_widget)
         file_layout.setContentsMargins(6, 4, 6, 4)
         file_layout.setSpacing(6)
 
-        # Filename label with elided text
+        # Filename label elided to its width, keeping the extension visible
         filename = Path(file_path).name
-        file_label = QLabel(filename)
+        file_label = _ElidedLabel(filename)
         file_label.setToolTip(file_path)
-
-        # Use text elision for long filenames
         file_label.setMinimumWidth(50)
         file_label.setSizePolicy(
             QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred
         )
-
-        # Truncate display if needed (longer limit now)
-        if len(filename) > 55:
-            display_name = filename[:52] + "..."
-            file_label.setText(display_name)
-
         file_layout.addWidget(file_label, 1)
 
         # Remove button
         remove_btn = QPushButton("✕")
         remove_btn.setFixedSize(18, 18)
         remove_btn.setToolTip(f"Remove {filename}")
-        apply_css_class(remove_btn, "file-remove-button")
-        remove_btn.clicked.connect(lambda: self._remove_file(file_path))
+        remove_btn.setProperty("class", "file-remove-button")
+        remove_btn.setProperty("filePath", file_path)
+        remove_btn.clicked.connect(self._on_remove_clicked)
         file_layout.addWidget(remove_btn)
 
         # Insert before the stretch
         insert_index = self._file_items_layout.count() - 1
         self._file_items_layout.insertWidget(insert_index, file_widget)
+        self._item_widgets[file_path] = file_widget
+
+    def _on_remove_clicked(self) -> None:
+        """Remove the file associated with the clicked remove button."""
+        self._remove_file(self.sender().property("filePath"))
 
     def _remove_file(self, file_path: str) -> None:
         """Remove a file from the list.
@@ -304,9 +584,19 @@ class PDFDropZone(QWidget):
         file_path : str
             The path of the file to remove.
         """
-        if file_path in self._files:
+        file_path = os.path.normpath(file_path)
+        if file_path in self._files_set:
             self._files.remove(file_path)
-            self._update_file_list()
+            self._files_set.discard(file_path)
+            self._files_paths_cache = None
+            n_rows = len(self._item_widgets)
+            file_widget = self._item_widgets.pop(file_path, None)
+            if file_widget is not None:
+                self._file_items_layout.removeWidget(file_widget)
+                file_widget.deleteLater()
+                # keep the number of rows by creating the next one, if any
+                self._materialize_rows(n_rows)
+            self._update_info_label()
             self.filesChanged.emit()
 
     def get_files(self) -> list[Path]:
@@ -317,7 +607,9 @@ class PDFDropZone(QWidget):
         list of Path
             List of file paths.
         """
-        return [Path(f) for f in self._files]
+        if self._files_paths_cache is None:
+            self._files_paths_cache = [Path(f) for f in self._files]
+        return list(self._files_paths_cache)
 
     def get_file_paths(self) -> list[str]:
         """Get the list of selected file paths as strings.
@@ -331,8 +623,14 @@ class PDFDropZone(QWidget):
 
     def clear_files(self) -> None:
         """Clear all files from the widget."""
+        if self._pending_files or self._rejected_files:
+            self._pending_files.clear()
+            self._rejected_files.clear()
+            self._update_info_label()
         if self._files:
             self._files.clear()
+            self._files_set.clear()
+            self._files_paths_cache = None
             self._update_file_list()
             self.filesChanged.emit()
 
@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 import qtawesome as qta
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import QEvent, QSignalBlocker, Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import QPixmap, QStandardItem, QStandardItemModel
 from PyQt6.QtWidgets import (
     QComboBox,
     QFileDialog,
     QHBoxLayout,
     QLabel,
+    QListView,
     QPushButton,
     QWidget,
 )
@@ -25,6 +28,9 @@ from llmde.prompts import (
 
 from ..utils import GUIConfig, set_validation_icon
 
+if TYPE_CHECKING:
+    from PyQt6.QtCore import QObject
+
 
 class PromptSelectorWidget(QWidget):
     """Widget for selecting prompts or system instructions.
@@ -51,6 +57,9 @@ class PromptSelectorWidget(QWidget):
     NONE_ITEM = "(None)"
     BROWSE_ITEM = "Browse for file..."
 
+    # JSON indicator pixmaps keyed by schema presence, shared by all instances
+    _JSON_PIXMAP_CACHE: dict[bool, QPixmap] = {}
+
     def __init__(
         self,
         selector_type: Literal["prompt", "system"],
@@ -65,12 +74,24 @@ class PromptSelectorWidget(QWidget):
         self._is_builtin = True
         self._custom_path: str | None = None
         self._has_json_schema = False
+        # existence of custom files, cleared when the combo box gains focus
+        self._exists_cache: dict[str, bool] = {}
+        # paths of the current selection, resolved on first access after a change
+        self._paths_cached = False
+        self._prompt_path_cache: Path | None = None
+        self._json_path_cache: Path | None = None
+        # combo box index of each selectable entry, avoids findText scans
+        self._text_to_index: dict[str, int] = {}
+        # coalesce rapid selection changes, only the last one is processed
+        self._pending_text = ""
+        self._change_timer = QTimer(self)
+        self._change_timer.setSingleShot(True)
+        self._change_timer.setInterval(50)
+        self._change_timer.timeout.connect(self._apply_combo_change)
 
         self._setup_ui()
         self._populate_combo()
         self._connect_signals()
-        # Trigger initial validation for the preselected item
-        self._on_combo_changed(self._combo.currentText())
 
     def _setup_ui(self) -> None:
         """Set up the user interface."""
@@ -89,6 +110,12 @@ class PromptSelectorWidget(QWidget):
         # Combo box for selection
         self._combo = QComboBox()
         self._combo.setMinimumWidth(200)
+        # Lay out the popup in batches to keep it responsive with many entries
+        view = QListView(self._combo)
+        view.setLayoutMode(QListView.LayoutMode.Batched)
+        view.setBatchSize(50)
+        self._combo.setView(view)
+        self._combo.installEventFilter(self)
         layout.addWidget(self._combo, 1)
 
         # JSON schema indicator (only for prompts)
@@ -104,6 +131,8 @@ class PromptSelectorWidget(QWidget):
         self._validation_icon = QLabel()
         self._validation_icon.setFixedSize(*GUIConfig.VALIDATION_ICON_SIZE)
         self._validation_icon.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        # initial icon, then only refreshed when the validation state changes
+        set_validation_icon(self._validation_icon, self._is_valid)
         layout.addWidget(self._validation_icon)
 
         # Edit button
@@ -116,29 +145,34 @@ class PromptSelectorWidget(QWidget):
 
     def _populate_combo(self) -> None:
         """Populate the combo box with built-in options."""
-        self._combo.clear()
-
+        # Build all the built-in entries in a single model assignment rather than
+        # one addItem call per entry
         if self._selector_type == "system":
-            # Add None option for system instructions (optional)
-            self._combo.addItem(self.NONE_ITEM)
-            self._combo.insertSeparator(1)
-
-            # Add built-in system instructions
-            builtins = list_system_instruction()
-            for name in sorted(builtins):
-                self._combo.addItem(name)
+            # None option first for system instructions (optional)
+            names = [self.NONE_ITEM, *sorted(list_system_instruction())]
         else:
-            # Add built-in prompts
-            builtins = list_prompt_files()
-            for name in sorted(builtins):
-                self._combo.addItem(name)
-
-        # Add separator and browse option
-        self._combo.insertSeparator(self._combo.count())
-        self._combo.addItem(self.BROWSE_ITEM)
-
-        # Set default selection
-        self._combo.setCurrentIndex(0)
+            names = sorted(list_prompt_files())
+        model = QStandardItemModel(self._combo)
+        if names:
+            model.appendColumn([QStandardItem(name) for name in names])
+        self._text_to_index = {name: k for k, name in enumerate(names)}
+        # Silence the intermediate selection changes, the final one is applied once
+        with QSignalBlocker(self._combo):
+            self._combo.setModel(model)
+            if self._selector_type == "system":
+                self._combo.insertSeparator(1)
+                # the separator shifts the system instructions after (None)
+                for name in names[1:]:
+                    self._text_to_index[name] += 1
+
+            # Add separator and browse option
+            self._combo.insertSeparator(self._combo.count())
+            self._combo.addItem(self.BROWSE_ITEM)
+
+            # Set default selection
+            self._combo.setCurrentIndex(0)
+        self._pending_text = self._combo.currentText()
+        self._apply_combo_change()
 
     def _connect_signals(self) -> None:
         """Connect internal signals."""
@@ -153,6 +187,12 @@ class PromptSelectorWidget(QWidget):
         text : str
             The selected text.
         """
+        self._pending_text = text
+        self._change_timer.start()
+
+    def _apply_combo_change(self) -> None:
+        """Process the last combo box selection change."""
+        text = self._pending_text
         if text == self.BROWSE_ITEM:
             self._browse_for_file()
             return
@@ -162,7 +202,7 @@ class PromptSelectorWidget(QWidget):
             self._is_builtin = True
             self._has_json_schema = False
             self._custom_path = None
-        elif Path(text).is_absolute():
+        elif os.path.isabs(text):
             # This is a custom path
             self._current_value = text
             self._is_builtin = False
@@ -177,6 +217,7 @@ class PromptSelectorWidget(QWidget):
 
         self._update_validation()
         self._update_json_indicator()
+        self._paths_cached = False
         self.selectionChanged.emit(self._current_value or "", self._is_builtin)
 
     def _browse_for_file(self) -> None:
@@ -190,18 +231,20 @@ class PromptSelectorWidget(QWidget):
 
         if file_path:
             # Add to combo if not already present
-            index = self._combo.findText(file_path)
+            index = self._text_to_index.get(file_path, -1)
             if index == -1:
-                # Insert before the separator (before Browse option)
+                # Insert before the separator (before Browse option), which only
+                # shifts the separator and the browse item
                 insert_pos = self._combo.count() - 2
                 self._combo.insertItem(insert_pos, file_path)
+                self._text_to_index[file_path] = insert_pos
                 self._combo.setCurrentIndex(insert_pos)
             else:
                 self._combo.setCurrentIndex(index)
         else:
             # User cancelled, revert to previous selection
             if self._current_value:
-                index = self._combo.findText(self._current_value)
+                index = self._text_to_index.get(self._current_value, -1)
                 if index >= 0:
                     self._combo.setCurrentIndex(index)
 
@@ -224,27 +267,64 @@ class PromptSelectorWidget(QWidget):
             return
 
         # Check for JSON file with same name
-        prompt_path = Path(self._custom_path)
-        json_path = prompt_path.with_suffix(".json")
-        self._has_json_schema = json_path.exists()
+        self._has_json_schema = self._exists(
+            os.path.splitext(self._custom_path)[0] + ".json"
+        )
+
+    def _exists(self, path: str) -> bool:
+        """Check if a file exists, caching the result until the next focus-in.
+
+        Parameters
+        ----------
+        path : str
+            The path to check.
+
+        Returns
+        -------
+        bool
+            True if the path exists.
+        """
+        exists = self._exists_cache.get(path)
+        if exists is None:
+            exists = self._exists_cache[path] = os.path.exists(path)
+        return exists
+
+    def eventFilter(self, obj: QObject, event: QEvent) -> bool:
+        """Filter events for the combo box to invalidate the file existence cache.
+
+        Parameters
+        ----------
+        obj : QObject
+            The object that received the event.
+        event : QEvent
+            The event.
+
+        Returns
+        -------
+        bool
+            True if the event was handled, False otherwise.
+        """
+        if obj is self._combo and event.type() == QEvent.Type.FocusIn:
+            # Files may have been created or deleted while the focus was elsewhere
+            self._exists_cache.clear()
+        return super().eventFilter(obj, event)
 
     def _update_json_indicator(self) -> None:
         """Update the JSON schema indicator icon."""
         if self._selector_type != "prompt":
             return
 
-        if self._has_json_schema:
-            icon = qta.icon(
-                GUIConfig.ICONS["json"], color=GUIConfig.COLORS["accent_primary"]
-            )
-            self._json_indicator.setPixmap(icon.pixmap(16, 16))
-            self._json_indicator.setToolTip("JSON schema attached")
-        else:
-            icon = qta.icon(
-                GUIConfig.ICONS["json"], color=GUIConfig.COLORS["text_muted"]
-            )
-            self._json_indicator.setPixmap(icon.pixmap(16, 16))
-            self._json_indicator.setToolTip("No JSON schema")
+        pixmap = self._JSON_PIXMAP_CACHE.get(self._has_json_schema)
+        if pixmap is None:
+            color = GUIConfig.COLORS[
+                "accent_primary" if self._has_json_schema else "text_muted"
+            ]
+            pixmap = qta.icon(GUIConfig.ICONS["json"], color=color).pixmap(16, 16)
+            self._JSON_PIXMAP_CACHE[self._has_json_schema] = pixmap
+        self._json_indicator.setPixmap(pixmap)
+        self._json_indicator.setToolTip(
+            "JSON schema attached" if self._has_json_schema else "No JSON schema"
+        )
 
     def _update_validation(self) -> None:
         """Update validation state and icon."""
@@ -261,11 +341,10 @@ class PromptSelectorWidget(QWidget):
                 self._is_valid = True
             else:
                 # Custom file must exist
-                self._is_valid = Path(self._current_value).exists()
-
-        set_validation_icon(self._validation_icon, self._is_valid)
+                self._is_valid = self._exists(self._current_value)
 
         if was_valid != self._is_valid:
+            set_validation_icon(self._validation_icon, self._is_valid)
             self.validationChanged.emit(self._is_valid)
 
     def _on_edit_clicked(self) -> None:
@@ -331,17 +410,9 @@ class PromptSelectorWidget(QWidget):
         Path | None
             The path to the prompt file.
         """
-        if self._current_value is None:
-            return None
-
-        if self._is_builtin:
-            if self._selector_type == "prompt":
-                path, _ = get_prompt(self._current_value)
-            else:
-                path = get_system_instruction(self._current_value)
-            return Path(str(path))
-        else:
-            return Path(self._current_value)
+        if not self._paths_cached:
+            self._cache_paths()
+        return self._prompt_path_cache
 
     def get_json_schema_path(self) -> Path | None:
         """Get the path to the JSON schema file if it exists.
@@ -351,16 +422,31 @@ class PromptSelectorWidget(QWidget):
         Path | None
             The path to the JSON schema file, or None.
         """
+        if not self._paths_cached:
+            self._cache_paths()
+        return self._json_path_cache
+
+    def _cache_paths(self) -> None:
+        """Resolve the prompt and JSON schema paths of the current selection."""
+        prompt_path = json_path = None
+        if self._current_value is not None:
+            if not self._is_builtin:
+                prompt_path = Path(self._current_value)
+            elif self._selector_type == "prompt":
+                path, builtin_json_path = get_prompt(self._current_value)
+                # resources may be a Traversable, convert to a concrete Path
+                prompt_path = Path(str(path))
+                if builtin_json_path is not None:
+                    json_path = Path(str(builtin_json_path))
+            else:
+                prompt_path = Path(str(get_system_instruction(self._current_value)))
+            if not self._is_builtin and self._custom_path:
+                json_path = prompt_path.with_suffix(".json")
         if self._selector_type != "prompt" or not self._has_json_schema:
-            return None
-
-        if self._is_builtin and self._current_value:
-            _, json_path = get_prompt(self._current_value)
-            return Path(str(json_path)) if json_path else None
-        elif self._custom_path:
-            return Path(self._custom_path).with_suffix(".json")
-
-        return None
+            json_path = None
+        self._prompt_path_cache = prompt_path
+        self._json_path_cache = json_path
+        self._paths_cached = True
 
     def setEnabled(self, enabled: bool) -> None:
         """Enable or disable the widget.
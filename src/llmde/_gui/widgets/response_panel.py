@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import qtawesome as qta
 from PyQt6.QtCore import QTimer
 from PyQt6.QtGui import QFont
@@ -19,6 +21,9 @@ from superqt.utils import CodeSyntaxHighlight
 from ...utils._text import strip_markdown_fences
 from ..utils import GUIConfig
 
+if TYPE_CHECKING:
+    from PyQt6.QtGui import QIcon
+
 
 class ResponsePanel(QWidget):
     """Panel for displaying LLM responses with copy functionality.
@@ -34,9 +39,16 @@ class ResponsePanel(QWidget):
     Includes a copy button to copy the response to clipboard.
     """
 
+    # copy button icons, rendered once and shared by all instances
+    _ICON_CACHE: dict[str, QIcon] = {}
+
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
+        # created on the first JSON response, then attached to and detached from the
+        # document instead of being rebuilt
         self._highlighter: CodeSyntaxHighlight | None = None
+        # text applied by set_response, to skip re-setting the same one
+        self._last_text: str | None = None
 
         self._setup_ui()
 
@@ -61,10 +73,7 @@ class ResponsePanel(QWidget):
         self._copy_btn.setFixedSize(32, 32)
         self._copy_btn.setToolTip("Copy response to clipboard")
         self._copy_btn.setEnabled(False)
-        copy_icon = qta.icon(
-            GUIConfig.ICONS["copy"], color=GUIConfig.COLORS["text_secondary"]
-        )
-        self._copy_btn.setIcon(copy_icon)
+        self._copy_btn.setIcon(self._get_icon("copy"))
         self._copy_btn.clicked.connect(self._copy_to_clipboard)
         header_layout.addWidget(self._copy_btn)
 
@@ -79,24 +88,42 @@ class ResponsePanel(QWidget):
         font = QFont("Consolas", 11)
         self._text_edit.setFont(font)
 
-        # Apply dark theme styling for response area
-        self._text_edit.setStyleSheet(
-            f"""
-            QPlainTextEdit {{
-                background-color: {GUIConfig.COLORS["response_bg"]};
-                color: {GUIConfig.COLORS["response_text"]};
-                border: 1px solid {GUIConfig.COLORS["border_primary"]};
-                border-radius: 4px;
-                padding: 10px;
-            }}
-            """
-        )
+        # Dark theme styling for the response area, from the application stylesheet
+        self._text_edit.setProperty("class", "response-text")
 
         # Set minimum height
         self._text_edit.setMinimumHeight(200)
 
         layout.addWidget(self._text_edit, 1)
 
+    @classmethod
+    def _get_icon(cls, name: str) -> QIcon:
+        """Get a copy button icon, rendering it on first use.
+
+        Parameters
+        ----------
+        name : str
+            The icon to get: ``"copy"`` or ``"copied"``.
+
+        Returns
+        -------
+        QIcon
+            The icon.
+        """
+        icon = cls._ICON_CACHE.get(name)
+        if icon is None:
+            if name == "copy":
+                icon = qta.icon(
+                    GUIConfig.ICONS["copy"], color=GUIConfig.COLORS["text_secondary"]
+                )
+            else:
+                icon = qta.icon(
+                    GUIConfig.ICONS["valid"],
+                    color=GUIConfig.COLORS["validation_success"],
+                )
+            cls._ICON_CACHE[name] = icon
+        return icon
+
     def set_response(self, text: str) -> None:
         """Set the response text.
 
@@ -107,6 +134,9 @@ class ResponsePanel(QWidget):
         """
         # Strip markdown code fences if present
         text = strip_markdown_fences(text)
+        if text == self._last_text:
+            return
+        self._last_text = text
 
         self._text_edit.setPlainText(text)
         self._copy_btn.setEnabled(bool(text.strip()))
@@ -117,12 +147,19 @@ class ResponsePanel(QWidget):
                 self._highlighter = CodeSyntaxHighlight(
                     self._text_edit.document(), "json", "github-dark"
                 )
-            self._highlighter.rehighlight()
+            elif self._highlighter.document() is None:
+                # re-attaching highlights the whole document
+                self._highlighter.setDocument(self._text_edit.document())
+            else:
+                self._highlighter.rehighlight()
         else:
-            # Remove highlighter for non-JSON content
-            if self._highlighter is not None:
-                self._highlighter.setDocument(None)
-                self._highlighter = None
+            # Detach highlighter for non-JSON content
+            self._detach_highlighter()
+
+    def _detach_highlighter(self) -> None:
+        """Detach the syntax highlighter from the document, keeping it for reuse."""
+        if self._highlighter is not None and self._highlighter.document() is not None:
+            self._highlighter.setDocument(None)
 
     def get_response(self) -> str:
         """Get the current response text.
@@ -136,13 +173,12 @@ class ResponsePanel(QWidget):
 
     def clear(self) -> None:
         """Clear the response text."""
+        self._last_text = None
         self._text_edit.clear()
         self._copy_btn.setEnabled(False)
 
-        # Remove highlighter
-        if self._highlighter is not None:
-            self._highlighter.setDocument(None)
-            self._highlighter = None
+        # Detach highlighter
+        self._detach_highlighter()
 
     def _copy_to_clipboard(self) -> None:
         """Copy the response text to clipboard."""
@@ -152,10 +188,7 @@ class ResponsePanel(QWidget):
             clipboard.setText(text)
 
             # Visual feedback - temporarily change button icon
-            success_icon = qta.icon(
-                GUIConfig.ICONS["valid"], color=GUIConfig.COLORS["validation_success"]
-            )
-            self._copy_btn.setIcon(success_icon)
+            self._copy_btn.setIcon(self._get_icon("copied"))
             self._copy_btn.setToolTip("Copied!")
 
             # Restore original icon after delay
@@ -163,10 +196,7 @@ class ResponsePanel(QWidget):
 
     def _restore_copy_icon(self) -> None:
         """Restore the copy button icon to its original state."""
-        copy_icon = qta.icon(
-            GUIConfig.ICONS["copy"], color=GUIConfig.COLORS["text_secondary"]
-        )
-        self._copy_btn.setIcon(copy_icon)
+        self._copy_btn.setIcon(self._get_icon("copy"))
         self._copy_btn.setToolTip("Copy response to clipboard")
 
     def set_loading(self, loading: bool) -> None:
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import json
+import os
+from collections import OrderedDict
+from threading import Lock
 from typing import TYPE_CHECKING
 
 from .utils._checks import ensure_path
@@ -8,6 +11,12 @@ from .utils._checks import ensure_path
 if TYPE_CHECKING:
     from pathlib import Path
 
+# contents of the markdown files read, keyed by (path, mtime_ns, size), least
+# recently used first
+_MARKDOWN_CACHE: OrderedDict[tuple[str, int, int], str] = OrderedDict()
+_MARKDOWN_CACHE_SIZE: int = 32
+_MARKDOWN_CACHE_LOCK = Lock()
+
 
 def read_markdown(path: str | Path) -> str:
     """Read a markdown file.
@@ -16,10 +25,27 @@ def read_markdown(path: str | Path) -> str:
     ----------
     path : str | Path
         The path to the markdown file.
+
+    Notes
+    -----
+    The content is cached by path, modification time and size, thus a file is only
+    read again once it changed on disk.
     """
     path = ensure_path(path, must_exist=True)
+    stat = os.stat(path)
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    with _MARKDOWN_CACHE_LOCK:
+        content = _MARKDOWN_CACHE.get(key)
+        if content is not None:
+            _MARKDOWN_CACHE.move_to_end(key)
+            return content
     with open(path, encoding="utf-8") as fid:
-        return fid.read()
+        content = fid.read()
+    with _MARKDOWN_CACHE_LOCK:
+        _MARKDOWN_CACHE[key] = content
+        if len(_MARKDOWN_CACHE) > _MARKDOWN_CACHE_SIZE:
+            _MARKDOWN_CACHE.popitem(last=False)
+    return content
 
 
 def read_json_schema(path: str | Path) -> dict:
@@ -1,2 +1,3 @@
+from ._base import BatchRequest
 from ._claude import ClaudeModel
 from ._gemini import GeminiModel
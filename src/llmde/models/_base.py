@@ -1,15 +1,233 @@
 from __future__ import annotations
 
+import hashlib
+import os
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from collections.abc import Iterable
-from typing import TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from threading import Lock
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from ..io import read_markdown
 from ..utils._checks import check_type, ensure_path
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from pathlib import Path
 
+# number of files from which the existence checks are spread over worker threads
+_PARALLEL_STAT_THRESHOLD: int = 8
+# maximum number of files uploaded concurrently to the provider
+_MAX_UPLOAD_WORKERS: int = 10
+
+# responses of the cached queries, keyed by a digest of the query inputs, least
+# recently used first
+_RESPONSE_CACHE: OrderedDict[str, str] = OrderedDict()
+_RESPONSE_CACHE_SIZE: int = 128
+_RESPONSE_CACHE_LOCK = Lock()
+
+_T = TypeVar("_T")
+
+
+def _ensure_existing_paths(files: Iterable[str | Path]) -> list[Path]:
+    """Convert files to paths and check that they all exist.
+
+    Parameters
+    ----------
+    files : Iterable of str | Path
+        The files to check.
+
+    Returns
+    -------
+    paths : list of Path
+        The validated paths, in the same order.
+
+    Notes
+    -----
+    For more than a handful of files, the ``stat`` calls are issued from a thread
+    pool to overlap their latency, which dominates on network file systems.
+    """
+    paths = [ensure_path(file, must_exist=False) for file in files]
+    if len(paths) <= _PARALLEL_STAT_THRESHOLD:
+        exists = [os.path.exists(path) for path in paths]
+    else:
+        with ThreadPoolExecutor(max_workers=_PARALLEL_STAT_THRESHOLD) as executor:
+            exists = list(executor.map(os.path.exists, paths))
+    for path, path_exists in zip(paths, exists, strict=True):
+        if not path_exists:
+            raise FileNotFoundError(f"The provided path '{str(path)}' does not exist.")
+    return paths
+
+
+def _upload_files(upload: Callable[[Path], _T], files: list[Path]) -> list[_T]:
+    """Upload files concurrently.
+
+    Parameters
+    ----------
+    upload : Callable
+        Function uploading a single file and returning its handle.
+    files : list of Path
+        The files to upload.
+
+    Returns
+    -------
+    uploaded : list
+        The handles returned by ``upload``, in the same order as ``files``.
+    """
+    if len(files) <= 1:
+        return [upload(file) for file in files]
+    with ThreadPoolExecutor(
+        max_workers=min(_MAX_UPLOAD_WORKERS, len(files))
+    ) as executor:
+        return list(executor.map(upload, files))
+
+
+def _upload_batch(
+    upload: Callable[[Path], _T], files: list[list[Path]]
+) -> list[list[_T]]:
+    """Upload the files of several queries concurrently, each file once.
+
+    Parameters
+    ----------
+    upload : Callable
+        Function uploading a single file and returning its handle.
+    files : list of list of Path
+        The files to upload, per query.
+
+    Returns
+    -------
+    uploaded : list of list
+        The handles returned by ``upload``, per query and in the same order as
+        ``files``. A file shared by several queries is uploaded once and its handle
+        is reused.
+    """
+    unique = list(dict.fromkeys(file for elt in files for file in elt))
+    handles = dict(zip(unique, _upload_files(upload, unique), strict=True))
+    return [[handles[file] for file in elt] for elt in files]
+
+
+def _check_poll_interval(poll_interval: float) -> None:
+    """Check that a batch poll interval is a strictly positive number."""
+    check_type(poll_interval, ("numeric",), "poll_interval")
+    if poll_interval <= 0:
+        raise ValueError(
+            "The poll interval must be strictly positive. Provided "
+            f"{poll_interval} is invalid."
+        )
+
+
+@lru_cache(maxsize=256)
+def _file_digest(path: str, mtime_ns: int, size: int) -> bytes:
+    """Hash the content of a file, cached by path, modification time and size."""
+    with open(path, "rb") as fid:
+        return hashlib.file_digest(fid, "sha256").digest()
+
+
+def _update_digest(hasher: hashlib.blake2b, path: str | os.PathLike) -> None:
+    """Add the content of a file to a running digest."""
+    stat = os.stat(path)
+    hasher.update(_file_digest(os.fspath(path), stat.st_mtime_ns, stat.st_size))
+
+
+@dataclass(frozen=True, slots=True)
+class ModelConfig:
+    """Validated model name and generation parameters.
+
+    Parameters
+    ----------
+    model_name : str
+        The name of the model to use.
+    system_instruction : str | None
+        System instruction provided to the model.
+    temperature : float | None
+        Sampling temperature, between ``0.0`` and ``1.0``.
+    top_p : float | None
+        Nucleus sampling threshold, between ``0.0`` and ``1.0``.
+    top_k : int | None
+        Number of most probable tokens to sample from, ``>= 1``.
+    max_tokens : int
+        Maximum number of tokens to generate, ``> 0``.
+
+    Notes
+    -----
+    Built-in ``int``/``float``/``str`` values are validated with direct type checks;
+    other types (e.g. NumPy scalars) go through :func:`~llmde.utils._checks.check_type`
+    which accepts them or raises the usual ``TypeError``.
+    """
+
+    model_name: str
+    system_instruction: str | None = None
+    temperature: float | None = None
+    top_p: float | None = None
+    top_k: int | None = None
+    max_tokens: int = 4096
+
+    def __post_init__(self) -> None:
+        if type(self.model_name) is not str:
+            check_type(self.model_name, (str,), "model_name")
+        if (
+            self.system_instruction is not None
+            and type(self.system_instruction) is not str
+        ):
+            check_type(self.system_instruction, (str, None), "system_instruction")
+
+        temperature = self.temperature
+        if temperature is not None:
+            if type(temperature) not in (float, int):
+                check_type(temperature, ("numeric", None), "temperature")
+            if not 0.0 <= temperature <= 1.0:
+                raise ValueError(
+                    f"Temperature must be between 0.0 and 1.0. Provided {temperature} "
+                    "is invalid."
+                )
+
+        top_p = self.top_p
+        if top_p is not None:
+            if type(top_p) not in (float, int):
+                check_type(top_p, ("numeric", None), "top_p")
+            if not 0.0 <= top_p <= 1.0:
+                raise ValueError(
+                    f"top_p must be between 0.0 and 1.0. Provided {top_p} is invalid."
+                )
+
+        top_k = self.top_k
+        if top_k is not None:
+            if type(top_k) is not int:
+                check_type(top_k, ("int-like", None), "top_k")
+            if top_k < 1:
+                raise ValueError(f"top_k must be >= 1. Provided {top_k} is invalid.")
+
+        max_tokens = self.max_tokens
+        if type(max_tokens) is not int:
+            check_type(max_tokens, ("int-like",), "max_tokens")
+        if max_tokens <= 0:
+            raise ValueError(
+                f"max_tokens must be a positive integer. Provided {max_tokens} is "
+                "invalid."
+            )
+
+
+@dataclass(frozen=True, slots=True)
+class BatchRequest:
+    """A query of a batch submitted with :meth:`BaseModel.submit_batch`.
+
+    Parameters
+    ----------
+    prompt : str | Path
+        The path to the prompt file to send to the model.
+    files : Iterable[str | Path]
+        The file paths (PDFs) to upload and analyze with the prompt.
+    kwargs : dict
+        Additional backend-specific arguments, e.g. ``json_schema`` for Gemini.
+    """
+
+    prompt: str | Path
+    files: Iterable[str | Path]
+    kwargs: dict[str, Any] = field(default_factory=dict)
+
 
 class BaseModel(ABC):
     """Abstract base class for all models."""
@@ -93,50 +311,217 @@ class BaseModel(ABC):
         See https://towardsdatascience.com/how-to-write-expert-prompts-for-chatgpt-gpt-4-and-other-language-models-23133dc85550/
         for prompt engineering tips and best practices.
         """
-        check_type(model_name, (str,), "model_name")
-        check_type(api_key, (str,), "api_key")
+        # The API key is validated but not stored in the (printable) config
+        self._model_config = ModelConfig(
+            model_name,
+            system_instruction=system_instruction,
+            temperature=temperature,
+            top_p=top_p,
+            top_k=top_k,
+            max_tokens=max_tokens,
+        )
+        if type(api_key) is not str:
+            check_type(api_key, (str,), "api_key")
         self._model_name = model_name
 
-        # Validate system_instruction
-        check_type(system_instruction, (str, None), "system_instruction")
+    def query(
+        self,
+        prompt: str | Path,
+        files: Iterable[str | Path],
+        *,
+        cache: bool = False,
+        **kwargs,
+    ) -> str:
+        """Query the model with a given prompt and return the response.
 
-        # Validate temperature
-        check_type(temperature, ("numeric", None), "temperature")
-        if temperature is not None and (temperature < 0.0 or temperature > 1.0):
-            raise ValueError(
-                f"Temperature must be between 0.0 and 1.0. Provided {temperature} is "
-                "invalid."
-            )
+        Parameters
+        ----------
+        prompt : str | Path
+            The path to the prompt file to send to the model.
+        files : Iterable[str | Path]
+            A list of file paths (PDFs) to upload and analyze with the prompt.
+        cache : bool
+            If True, the response of an identical previous query in this process is
+            returned instead of querying the model again.
+        **kwargs
+            Additional backend-specific arguments forwarded to the model.
 
-        # Validate top_p
-        check_type(top_p, ("numeric", None), "top_p")
-        if top_p is not None and (top_p < 0.0 or top_p > 1.0):
-            raise ValueError(
-                f"top_p must be between 0.0 and 1.0. Provided {top_p} is invalid."
-            )
+        Returns
+        -------
+        response : str
+            The text response from the model.
 
-        # Validate top_k
-        check_type(top_k, ("int-like", None), "top_k")
-        if top_k is not None and top_k < 1:
-            raise ValueError(f"top_k must be >= 1. Provided {top_k} is invalid.")
+        Notes
+        -----
+        Two queries are identical if they share the model class and configuration,
+        the prompt, the content of the files (in order) and the additional arguments,
+        where arguments pointing to files are compared by content.
+        """
+        check_type(cache, (bool,), "cache")
+        prompt = read_markdown(prompt)
+        check_type(files, (Iterable,), "files")
+        files = _ensure_existing_paths(files)
+        if not cache:
+            return self._execute(prompt, files, **kwargs)
 
-        # Validate max_tokens
-        check_type(max_tokens, ("int-like",), "max_tokens")
-        if max_tokens <= 0:
-            raise ValueError(
-                f"max_tokens must be a positive integer. Provided {max_tokens} is "
-                "invalid."
-            )
+        key = self._query_key(prompt, files, kwargs)
+        with _RESPONSE_CACHE_LOCK:
+            response = _RESPONSE_CACHE.get(key)
+            if response is not None:
+                _RESPONSE_CACHE.move_to_end(key)
+                return response
+        response = self._execute(prompt, files, **kwargs)
+        with _RESPONSE_CACHE_LOCK:
+            _RESPONSE_CACHE[key] = response
+            if len(_RESPONSE_CACHE) > _RESPONSE_CACHE_SIZE:
+                _RESPONSE_CACHE.popitem(last=False)
+        return response
+
+    def _query_key(self, prompt: str, files: list[Path], kwargs: dict) -> str:
+        """Compute the response cache key of a query."""
+        hasher = hashlib.blake2b()
+        hasher.update(f"{type(self).__qualname__}{self._model_config!r}".encode())
+        hasher.update(prompt.encode())
+        for file in files:
+            _update_digest(hasher, file)
+        for name, value in sorted(kwargs.items()):
+            hasher.update(name.encode())
+            if isinstance(value, str | os.PathLike) and os.path.isfile(value):
+                _update_digest(hasher, value)
+            else:
+                hasher.update(repr(value).encode())
+        return hasher.hexdigest()
 
     @abstractmethod
-    def query(self, prompt: str, files: list[str | Path]) -> tuple[str, list[Path]]:
-        """Query the model with a given prompt and return the response."""
-        prompt = read_markdown(prompt)
+    def _execute(self, prompt: str, files: list[Path], **kwargs) -> str:
+        """Send the loaded prompt and validated files to the model."""
+
+    def batch_query(
+        self,
+        prompt: str | Path,
+        files: Iterable[Iterable[str | Path]],
+        *,
+        poll_interval: float = 60.0,
+        **kwargs,
+    ) -> list[str | None]:
+        """Query the model through the provider batch API.
+
+        Parameters
+        ----------
+        prompt : str | Path
+            The path to the prompt file to send to the model, shared by all queries.
+        files : Iterable[Iterable[str | Path]]
+            The file paths (PDFs) to upload and analyze with the prompt, one set of
+            files per query.
+        poll_interval : float
+            Interval in seconds between two checks of the batch status.
+        **kwargs
+            Additional backend-specific arguments forwarded to the model.
+
+        Returns
+        -------
+        responses : list of str | None
+            The text response from the model for each query, in the same order as
+            ``files``. Queries which failed are set to ``None``.
+
+        Notes
+        -----
+        This is a shortcut for :meth:`submit_batch` followed by
+        :meth:`wait_for_batch`. Batches are processed asynchronously by the provider
+        at a reduced cost and within up to 24 hours, and this method blocks until
+        the batch ended. Use :meth:`query` for interactive use.
+        """
+        _check_poll_interval(poll_interval)
         check_type(files, (Iterable,), "files")
-        files = [ensure_path(file, must_exist=True) for file in files]
-        return prompt, files
+        files = list(files)
+        for elt in files:
+            # a str is iterable, but it is a single file and not a set of files
+            if isinstance(elt, str):
+                raise TypeError(
+                    "'files' must contain one set of files per query, got a str "
+                    f"'{elt}' instead."
+                )
+            check_type(elt, (Iterable,), "files")
+        if len(files) == 0:
+            return []
+        batch_id = self.submit_batch(
+            [BatchRequest(prompt, elt, kwargs) for elt in files]
+        )
+        return self.wait_for_batch(batch_id, poll_interval=poll_interval)
+
+    def submit_batch(self, requests: Iterable[BatchRequest]) -> str:
+        """Submit queries to the provider batch API without waiting for them.
+
+        Parameters
+        ----------
+        requests : Iterable[BatchRequest]
+            The queries to submit. A file shared by several queries is uploaded
+            once.
+
+        Returns
+        -------
+        batch_id : str
+            The provider identifier of the batch, to retrieve the responses with
+            :meth:`wait_for_batch`, possibly from another process.
+        """
+        check_type(requests, (Iterable,), "requests")
+        requests = list(requests)
+        if len(requests) == 0:
+            raise ValueError("At least one request is required to submit a batch.")
+        prompts, files, kwargs = [], [], []
+        for request in requests:
+            check_type(request, (BatchRequest,), "request")
+            check_type(request.files, (Iterable,), "files")
+            prompts.append(read_markdown(request.prompt))
+            files.append(_ensure_existing_paths(request.files))
+            kwargs.append(request.kwargs)
+        return self._submit_batch(prompts, files, kwargs)
+
+    def wait_for_batch(
+        self, batch_id: str, *, poll_interval: float = 60.0
+    ) -> list[str | None]:
+        """Wait for a submitted batch to end and retrieve its responses.
+
+        Parameters
+        ----------
+        batch_id : str
+            The provider identifier of the batch, returned by :meth:`submit_batch`.
+        poll_interval : float
+            Interval in seconds between two checks of the batch status.
+
+        Returns
+        -------
+        responses : list of str | None
+            The text response from the model for each query, in the submission
+            order. Queries which failed are set to ``None``.
+
+        Raises
+        ------
+        RuntimeError
+            If the batch ended without any result, e.g. because it failed, was
+            cancelled or expired as a whole. Waiting for it again will not help, the
+            requests must be submitted in a new batch.
+        """
+        check_type(batch_id, (str,), "batch_id")
+        _check_poll_interval(poll_interval)
+        return self._wait_for_batch(batch_id, poll_interval)
+
+    @abstractmethod
+    def _submit_batch(
+        self, prompts: list[str], files: list[list[Path]], kwargs: list[dict]
+    ) -> str:
+        """Submit the loaded prompts and validated files as a batch."""
+
+    @abstractmethod
+    def _wait_for_batch(self, batch_id: str, poll_interval: float) -> list[str | None]:
+        """Wait for a batch to end and return its responses in submission order."""
 
     @property
     def model_name(self) -> str:
         """Get the name of the model."""
         return self._model_name
+
+    @property
+    def model_config(self) -> ModelConfig:
+        """Get the validated model configuration."""
+        return self._model_config
@@ -1,15 +1,37 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
-from typing import TYPE_CHECKING
+import time
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
-from anthropic import Anthropic
-
-from ._base import BaseModel
+from ..utils.logs import warn
+from ._base import BaseModel, _upload_batch, _upload_files
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from pathlib import Path
 
+    from anthropic import Anthropic
+
+_FILES_API_BETA: str = "files-api-2025-04-14"
+
+
+@lru_cache(maxsize=8)
+def _get_client(api_key: str) -> Anthropic:
+    """Get the client for an API key, shared to reuse its connection pool."""
+    # the SDK is imported on first use, to only load the one of the selected backend
+    from anthropic import Anthropic
+
+    return Anthropic(api_key=api_key)
+
+
+def _first_text(content: Iterable[Any]) -> str | None:
+    """Get the text of the first text block of a message content, if any."""
+    for content_block in content:
+        if content_block.type == "text":
+            return content_block.text
+    return None
+
 
 class ClaudeModel(BaseModel):
     def __init__(
@@ -87,11 +109,18 @@ class ClaudeModel(BaseModel):
             top_k=top_k,
             max_tokens=max_tokens,
         )
-        self._client = Anthropic(api_key=api_key)
+        if temperature is not None and top_p is not None:
+            warn(
+                "Anthropic recommends to set either 'temperature' or 'top_p', not "
+                "both. Both are sent to the API as provided."
+            )
+        self._client = _get_client(api_key)
 
         # Create Claude-specific config dictionary
         # Note: Claude API uses "system" instead of "system_instruction"
-        self._config = {
+        # Note: Claude uses a built-in "omit" system instead of `None`, thus we filter
+        # out None values once from config before passing to API.
+        config = {
             "model": model_name,
             "system": system_instruction,
             "temperature": temperature,
@@ -99,37 +128,73 @@ class ClaudeModel(BaseModel):
             "top_k": top_k,
             "max_tokens": max_tokens,
         }
+        self._config = {k: v for k, v in config.items() if v is not None}
 
-    def query(self, prompt: str | Path, files: Iterable[str | Path]) -> str:
-        """Query the Claude model with a given prompt and return the response.
-
-        Parameters
-        ----------
-        prompt : str | Path
-            The path to the prompt file to send to the model.
-        files : Iterable[str | Path]
-            A list of file paths (PDFs) to upload and analyze with the prompt.
-
-        Returns
-        -------
-        response : str
-            The text response from the model.
+    def _execute(self, prompt: str, files: list[Path]) -> str:
+        """Send the prompt and files to Claude.
 
         Notes
         -----
         This method uses Claude's Files API to upload documents.
         """
-        prompt, files = super().query(prompt, files)
-
         # Upload files using the Files API
-        uploaded_file_ids = []
-        for file_path in files:
-            with open(file_path, "rb") as fid:
-                uploaded_file = self._client.beta.files.upload(
-                    file=(file_path.name, fid, "application/pdf")
+        uploaded_file_ids = _upload_files(self._upload, files)
+
+        # Make API call with Files API beta flag, streamed so that the response is
+        # received while it is generated instead of after the full generation
+        with self._client.beta.messages.stream(
+            **self._message_params(prompt, uploaded_file_ids),
+            betas=[_FILES_API_BETA],
+        ) as stream:
+            response = stream.get_final_message()
+
+        text = _first_text(response.content)
+        if text is None:
+            raise ValueError("No text content found in response")
+        return text
+
+    def _submit_batch(
+        self, prompts: list[str], files: list[list[Path]], kwargs: list[dict]
+    ) -> str:
+        """Submit the prompts and files to the Claude Message Batches API."""
+        for elt in kwargs:
+            if len(elt) != 0:
+                raise TypeError(
+                    f"Unexpected arguments for a Claude batch request: {sorted(elt)}."
                 )
-            uploaded_file_ids.append(uploaded_file.id)
-
+        uploaded_file_ids = _upload_batch(self._upload, files)
+        batch = self._client.beta.messages.batches.create(
+            requests=[
+                {"custom_id": str(k), "params": self._message_params(prompt, file_ids)}
+                for k, (prompt, file_ids) in enumerate(
+                    zip(prompts, uploaded_file_ids, strict=True)
+                )
+            ],
+            betas=[_FILES_API_BETA],
+        )
+        return batch.id
+
+    def _wait_for_batch(self, batch_id: str, poll_interval: float) -> list[str | None]:
+        """Wait for a Claude message batch and retrieve its responses."""
+        batches = self._client.beta.messages.batches
+        batch = batches.retrieve(batch_id, betas=[_FILES_API_BETA])
+        while batch.processing_status != "ended":
+            time.sleep(poll_interval)
+            batch = batches.retrieve(batch_id, betas=[_FILES_API_BETA])
+
+        # every request has a result once the batch ended, but results are not
+        # returned in the submission order
+        responses: dict[int, str | None] = {}
+        for entry in batches.results(batch_id, betas=[_FILES_API_BETA]):
+            responses[int(entry.custom_id)] = (
+                _first_text(entry.result.message.content)
+                if entry.result.type == "succeeded"
+                else None
+            )
+        return [responses.get(k) for k in range(len(responses))]
+
+    def _message_params(self, prompt: str, file_ids: list[str]) -> dict[str, Any]:
+        """Build the message creation parameters for a prompt and uploaded files."""
         # Build message content with uploaded files
         message_content = [
             {
@@ -139,35 +204,29 @@ class ClaudeModel(BaseModel):
                     "file_id": file_id,
                 },
             }
-            for file_id in uploaded_file_ids
+            for file_id in file_ids
         ]
         message_content.append({"type": "text", "text": prompt})
 
         # Create message with appropriate parameters
-        # Note: Claude uses a built-in "omit" system instead of `None`, thus we filter
-        # out None values from config before passing to API.
-        kwargs = {k: v for k, v in self._config.items() if v is not None}
-        kwargs["messages"] = [{"role": "user", "content": message_content}]
-
-        # Make API call with Files API beta flag
-        response = self._client.beta.messages.create(
-            **kwargs,
-            betas=["files-api-2025-04-14"],
-        )
+        return {
+            **self._config,
+            "messages": [{"role": "user", "content": message_content}],
+        }
 
-        # Extract text response
-        for content_block in response.content:
-            if content_block.type == "text":
-                return content_block.text
-        raise ValueError("No text content found in response")
+    def _upload(self, file_path: Path) -> str:
+        """Upload a PDF file with the Files API and return its ID."""
+        with open(file_path, "rb") as fid:
+            uploaded_file = self._client.beta.files.upload(
+                file=(file_path.name, fid, "application/pdf")
+            )
+        return uploaded_file.id
 
     def close(self) -> None:
-        """Close the model client."""
-        self._client.close()
-
-    def __del__(self) -> None:
-        """Clean up resources when the model is deleted."""
-        try:
-            self.close()
-        except Exception:
-            pass
+        """Close the model client.
+
+        Notes
+        -----
+        The client is shared by all the models using the same API key and is kept
+        open to reuse its connections; this method is kept for API compatibility.
+        """
@@ -1,17 +1,40 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
-from copy import deepcopy
+import os
+import time
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
-from google import genai
-from google.genai import types
-
 from ..io import read_json_schema
-from ._base import BaseModel
+from ..utils._checks import ensure_path
+from ._base import BaseModel, _upload_batch, _upload_files
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from pathlib import Path
+    from types import ModuleType
+
+    from google import genai
+    from google.genai import types
+
+
+@lru_cache(maxsize=1)
+def _get_types() -> ModuleType:
+    """Get the ``google.genai.types`` module, imported on first use."""
+    # the SDK is imported on first use, to only load the one of the selected backend
+    from google.genai import types
+
+    return types
+
+
+@lru_cache(maxsize=8)
+def _get_client(api_key: str) -> genai.Client:
+    """Get the client for an API key, shared to reuse its connection pool."""
+    from google import genai
+
+    return genai.Client(
+        api_key=api_key, http_options=_get_types().HttpOptions(api_version="v1")
+    )
 
 
 class GeminiModel(BaseModel):
@@ -91,9 +114,7 @@ class GeminiModel(BaseModel):
             top_k=top_k,
             max_tokens=max_tokens,
         )
-        self._client = genai.Client(
-            api_key=api_key, http_options=types.HttpOptions(api_version="v1")
-        )
+        self._client = _get_client(api_key)
 
         # Create Gemini-specific config dictionary
         # Note: Gemini API uses "max_output_tokens" instead of "max_tokens"
@@ -104,12 +125,20 @@ class GeminiModel(BaseModel):
             "top_k": top_k,
             "max_output_tokens": max_tokens,
         }
+        self._generation_config = _get_types().GenerateContentConfig(**self._config)
+        # generation config with a JSON schema, keyed by (path, mtime_ns, size) of the
+        # last schema used
+        self._schema_config: (
+            tuple[tuple[str, int, int], types.GenerateContentConfig] | None
+        ) = None
 
     def query(
         self,
         prompt: str | Path,
         files: Iterable[str | Path],
         json_schema: str | Path | None = None,
+        *,
+        cache: bool = False,
     ) -> str:
         """Query the Gemini model with a given prompt and return the response.
 
@@ -121,38 +150,140 @@ class GeminiModel(BaseModel):
             A list of file paths to upload with the prompt.
         json_schema : str | Path | None
             The file to the JSON schema for the expected response format.
+        cache : bool
+            If True, the response of an identical previous query in this process is
+            returned instead of querying the model again.
 
         Returns
         -------
         response : str
             The text response from the model.
         """
-        prompt, files = super().query(prompt, files)
+        return super().query(prompt, files, cache=cache, json_schema=json_schema)
 
-        # Add JSON schema for response, if provided
-        if json_schema is not None:
-            config = deepcopy(self._config)
-            config["response_mime_type"] = "application/json"
-            config["response_json_schema"] = read_json_schema(json_schema)
-        else:
-            config = self._config
+    def batch_query(
+        self,
+        prompt: str | Path,
+        files: Iterable[Iterable[str | Path]],
+        json_schema: str | Path | None = None,
+        *,
+        poll_interval: float = 60.0,
+    ) -> list[str | None]:
+        """Query the Gemini model through the Batch API.
+
+        Parameters
+        ----------
+        prompt : str | Path
+            The file to the prompt to send to the model, shared by all queries.
+        files : Iterable[Iterable[str | Path]]
+            The file paths to upload with the prompt, one set of files per query.
+        json_schema : str | Path | None
+            The file to the JSON schema for the expected response format.
+        poll_interval : float
+            Interval in seconds between two checks of the batch status.
+
+        Returns
+        -------
+        responses : list of str | None
+            The text response from the model for each query, in the same order as
+            ``files``. Queries which failed are set to ``None``.
+        """
+        return super().batch_query(
+            prompt, files, poll_interval=poll_interval, json_schema=json_schema
+        )
+
+    def _execute(
+        self, prompt: str, files: list[Path], json_schema: str | Path | None = None
+    ) -> str:
+        """Send the prompt and files to Gemini."""
+        config = self._query_config(json_schema)
 
         # Upload files and generate content
-        uploaded_files = [self._client.files.upload(file=file) for file in files]
+        uploaded_files = _upload_files(self._upload, files)
         response = self._client.models.generate_content(
             model=self._model_name,
             contents=[prompt, *uploaded_files],
-            config=types.GenerateContentConfig(**config),
+            config=config,
         )
         return response.text
 
+    def _submit_batch(
+        self, prompts: list[str], files: list[list[Path]], kwargs: list[dict]
+    ) -> str:
+        """Submit the prompts and files to the Gemini Batch API."""
+        types = _get_types()
+        configs = {}  # generation config per JSON schema
+        for elt in kwargs:
+            if len(unexpected := set(elt) - {"json_schema"}) != 0:
+                raise TypeError(
+                    "Unexpected arguments for a Gemini batch request: "
+                    f"{sorted(unexpected)}."
+                )
+            json_schema = elt.get("json_schema")
+            if json_schema not in configs:
+                configs[json_schema] = self._query_config(json_schema)
+        uploaded_files = _upload_batch(self._upload, files)
+        job = self._client.batches.create(
+            model=self._model_name,
+            src=[
+                types.InlinedRequest(
+                    contents=[prompt, *elt],
+                    config=configs[request_kwargs.get("json_schema")],
+                )
+                for prompt, elt, request_kwargs in zip(
+                    prompts, uploaded_files, kwargs, strict=True
+                )
+            ],
+        )
+        return job.name
+
+    def _wait_for_batch(self, batch_id: str, poll_interval: float) -> list[str | None]:
+        """Wait for a Gemini batch job and retrieve its responses."""
+        types = _get_types()
+        done_states = (
+            types.JobState.JOB_STATE_SUCCEEDED,
+            types.JobState.JOB_STATE_FAILED,
+            types.JobState.JOB_STATE_CANCELLED,
+            types.JobState.JOB_STATE_EXPIRED,
+        )
+        job = self._client.batches.get(name=batch_id)
+        while job.state not in done_states:
+            time.sleep(poll_interval)
+            job = self._client.batches.get(name=batch_id)
+        if job.state != types.JobState.JOB_STATE_SUCCEEDED:
+            raise RuntimeError(f"The batch job {job.name} ended with {job.state.name}.")
+        return [
+            None if elt.response is None else elt.response.text
+            for elt in job.dest.inlined_responses
+        ]
+
+    def _query_config(
+        self, json_schema: str | Path | None
+    ) -> types.GenerateContentConfig:
+        """Get the generation config, with the response format if provided."""
+        if json_schema is None:
+            return self._generation_config
+        path = ensure_path(json_schema, must_exist=True)
+        stat = os.stat(path)
+        key = (str(path), stat.st_mtime_ns, stat.st_size)
+        if self._schema_config is None or self._schema_config[0] != key:
+            config = _get_types().GenerateContentConfig(
+                **self._config,
+                response_mime_type="application/json",
+                response_json_schema=read_json_schema(path),
+            )
+            self._schema_config = (key, config)
+        return self._schema_config[1]
+
+    def _upload(self, file: Path) -> types.File:
+        """Upload a file with the Files API."""
+        return self._client.files.upload(file=file)
+
     def close(self) -> None:
-        """Close the model client."""
-        self._client.close()
-
-    def __del__(self) -> None:
-        """Clean up resources when the model is deleted."""
-        try:
-            self.close()
-        except Exception:
-            pass
+        """Close the model client.
+
+        Notes
+        -----
+        The client is shared by all the models using the same API key and is kept
+        open to reuse its connections; this method is kept for API compatibility.
+        """
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from importlib.resources import files
 from typing import TYPE_CHECKING
 
@@ -13,11 +14,17 @@ ASSETS_DIRECTORY = files("llmde.prompts") / "assets" / "prompts"
 
 def list_prompt_files() -> list[str]:
     """List all prompt files in the assets directory."""
-    return [
+    return list(_list_prompt_files())
+
+
+@lru_cache(maxsize=1)
+def _list_prompt_files() -> tuple[str, ...]:
+    """Scan the bundled prompt assets once."""
+    return tuple(
         file.stem
         for file in ASSETS_DIRECTORY.iterdir()
         if file.is_file() and file.suffix == ".md"
-    ]
+    )
 
 
 def get_prompt(name: str) -> tuple[Path, Path | None]:
@@ -36,7 +43,13 @@ def get_prompt(name: str) -> tuple[Path, Path | None]:
         The path to the JSON schema file for the prompt, if applicable.
     """
     check_type(name, (str,), "name")
-    check_value(name, list_prompt_files(), "name")
+    check_value(name, _list_prompt_files(), "name")
+    return _get_prompt(name)
+
+
+@lru_cache
+def _get_prompt(name: str) -> tuple[Path, Path | None]:
+    """Resolve the prompt and JSON schema paths of a validated prompt name once."""
     prompt_path = ASSETS_DIRECTORY / f"{name}.md"
     json_path = ASSETS_DIRECTORY / f"{name}.json"
     return prompt_path, json_path if json_path.exists() else None
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from importlib.resources import files
 from typing import TYPE_CHECKING
 
@@ -13,11 +14,17 @@ ASSETS_DIRECTORY = files("llmde.prompts") / "assets" / "system"
 
 def list_system_instruction() -> list[str]:
     """List all system instruction files in the assets directory."""
-    return [
+    return list(_list_system_instruction())
+
+
+@lru_cache(maxsize=1)
+def _list_system_instruction() -> tuple[str, ...]:
+    """Scan the bundled system instruction assets once."""
+    return tuple(
         file.stem
         for file in ASSETS_DIRECTORY.iterdir()
         if file.is_file() and file.suffix == ".md"
-    ]
+    )
 
 
 def get_system_instruction(name: str) -> tuple[Path, Path | None]:
@@ -34,6 +41,6 @@ def get_system_instruction(name: str) -> tuple[Path, Path | None]:
         The path to the prompt file.
     """
     check_type(name, (str,), "name")
-    check_value(name, list_system_instruction(), "name")
+    check_value(name, _list_system_instruction(), "name")
     prompt_path = ASSETS_DIRECTORY / f"{name}.md"
     return prompt_path
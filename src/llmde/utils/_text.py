@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-import re
+_FENCE = "```"
+_FENCE_LANGUAGE = "json"
 
 
 def strip_markdown_fences(text: str) -> str:
@@ -30,9 +31,15 @@ def strip_markdown_fences(text: str) -> str:
     >>> strip_markdown_fences('{"key": "value"}')
     '{"key": "value"}'
     """
-    # Pattern matches ```json or ``` at start, and ``` at end
-    pattern = r"^```(?:json)?\s*\n?(.*?)\n?```\s*$"
-    match = re.match(pattern, text.strip(), re.DOTALL)
-    if match:
-        return match.group(1).strip()
-    return text
+    stripped = text.strip()
+    # both fences are required and must not overlap
+    if (
+        len(stripped) < 2 * len(_FENCE)
+        or not stripped.startswith(_FENCE)
+        or not stripped.endswith(_FENCE)
+    ):
+        return text
+    body = stripped[len(_FENCE) : -len(_FENCE)]
+    if body.startswith(_FENCE_LANGUAGE):
+        body = body[len(_FENCE_LANGUAGE) :]
+    return body.strip()
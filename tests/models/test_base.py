@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from llmde.models import BatchRequest
+from llmde.models._base import (
+    _RESPONSE_CACHE,
+    _RESPONSE_CACHE_SIZE,
+    BaseModel,
+    ModelConfig,
+)
+
+if TYPE_CHECKING:
+    from collections import OrderedDict
+    from collections.abc import Generator
+    from pathlib import Path
+
+
+class _StubModel(BaseModel):
+    """Model recording the calls to the provider hooks."""
+
+    def __init__(self) -> None:
+        super().__init__("stub", "key")
+        self.calls: list[str] = []
+        self.batches: dict[str, list[str]] = {}
+
+    def _execute(self, prompt: str, files: list[Path], **kwargs) -> str:
+        self.calls.append("execute")
+        return f"{prompt}:{len(self.calls)}"
+
+    def _submit_batch(
+        self, prompts: list[str], files: list[list[Path]], kwargs: list[dict]
+    ) -> str:
+        self.calls.append("submit")
+        batch_id = f"batch-{len(self.batches)}"
+        self.batches[batch_id] = [
+            f"{prompt}:{len(elt)}" for prompt, elt in zip(prompts, files, strict=True)
+        ]
+        return batch_id
+
+    def _wait_for_batch(self, batch_id: str, poll_interval: float) -> list[str | None]:
+        self.calls.append("wait")
+        return self.batches[batch_id]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"system_instruction": "instruction"},
+        {"temperature": 0, "top_p": 1, "top_k": 1, "max_tokens": 1},
+        {"temperature": 0.5, "top_p": 0.95, "top_k": 40},
+        {
+            "temperature": np.float64(0.5),
+            "top_p": np.float32(0.5),
+            "top_k": np.int64(40),
+            "max_tokens": np.int32(1024),
+        },
+    ],
+)
+def test_model_config(kwargs: dict) -> None:
+    """Test the validation of valid model parameters."""
+    config = ModelConfig("model", **kwargs)
+    assert config.model_name == "model"
+    for key, value in kwargs.items():
+        assert getattr(config, key) == value
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+        ({"temperature": -0.1}, r"Temperature must be between 0\.0 and 1\.0\. "),
+        ({"temperature": np.float64(1.5)}, "Temperature must be between"),
+        ({"top_p": 1.1}, r"top_p must be between 0\.0 and 1\.0\. Provided 1\.1 "),
+        ({"top_p": -1}, "top_p must be between"),
+        ({"top_k": 0}, "top_k must be >= 1. Provided 0 is invalid."),
+        ({"top_k": np.int64(-1)}, "top_k must be >= 1."),
+        ({"max_tokens": 0}, "max_tokens must be a positive integer. Provided 0 "),
+        ({"max_tokens": -10}, "max_tokens must be a positive integer."),
+    ],
+)
+def test_model_config_invalid_value(kwargs: dict, match: str) -> None:
+    """Test the validation of out-of-range model parameters."""
+    with pytest.raises(ValueError, match=match):
+        ModelConfig("model", **kwargs)
+
+
+@pytest.mark.parametrize(
+    ("model_name", "kwargs", "match"),
+    [
+        (101, {}, "'model_name' must be an instance of str"),
+        ("model", {"system_instruction": 101}, "'system_instruction' must be an"),
+        ("model", {"temperature": "0.5"}, "'temperature' must be an instance of"),
+        ("model", {"temperature": True}, "'temperature' must be an instance of"),
+        ("model", {"top_p": False}, "'top_p' must be an instance of"),
+        ("model", {"top_k": 1.0}, "'top_k' must be an instance of int-like"),
+        ("model", {"top_k": True}, "'top_k' must be an instance of int-like"),
+        ("model", {"top_k": np.float64(1)}, "'top_k' must be an instance of"),
+        ("model", {"max_tokens": 1024.0}, "'max_tokens' must be an instance of"),
+        ("model", {"max_tokens": True}, "'max_tokens' must be an instance of"),
+        ("model", {"max_tokens": None}, "'max_tokens' must be an instance of"),
+    ],
+)
+def test_model_config_invalid_type(model_name, kwargs: dict, match: str) -> None:
+    """Test the validation of model parameters of the wrong type."""
+    with pytest.raises(TypeError, match=match):
+        ModelConfig(model_name, **kwargs)
+
+
+@pytest.fixture
+def prompt(tmp_path: Path) -> Path:
+    """Create a prompt file."""
+    fname = tmp_path / "prompt.md"
+    fname.write_text("prompt", encoding="utf-8")
+    return fname
+
+
+@pytest.fixture
+def pdf(tmp_path: Path) -> Path:
+    """Create a PDF file."""
+    fname = tmp_path / "paper.pdf"
+    fname.write_bytes(b"%PDF-1.7")
+    return fname
+
+
+@pytest.fixture
+def response_cache() -> Generator[OrderedDict[str, str], None, None]:
+    """Start from an empty response cache."""
+    _RESPONSE_CACHE.clear()
+    yield _RESPONSE_CACHE
+    _RESPONSE_CACHE.clear()
+
+
+def test_query_cache(
+    response_cache: OrderedDict[str, str], prompt: Path, pdf: Path
+) -> None:
+    """Test the response cache of the queries."""
+    model = _StubModel()
+    assert model.query(prompt, [pdf], cache=True) == "prompt:1"
+    assert model.query(prompt, [pdf], cache=True) == "prompt:1"
+    assert model.query(str(prompt), [str(pdf)], cache=True) == "prompt:1"
+    assert model.calls == ["execute"]
+    # cache=False always queries the model, and does not store the response
+    assert model.query(prompt, [pdf]) == "prompt:2"
+    assert model.query(prompt, [pdf], cache=False) == "prompt:3"
+    assert model.query(prompt, [pdf], cache=True) == "prompt:1"
+    assert len(model.calls) == 3
+    # additional arguments are part of the key
+    assert model.query(prompt, [pdf], cache=True, json_schema=None) == "prompt:4"
+    assert len(response_cache) == 2
+
+
+def test_query_cache_file_changed(
+    response_cache: OrderedDict[str, str], prompt: Path, pdf: Path
+) -> None:
+    """Test that a change in the content of a file invalidates the cached response."""
+    model = _StubModel()
+    assert model.query(prompt, [pdf], cache=True) == "prompt:1"
+    pdf.write_bytes(b"%PDF-1.7 updated")
+    stat = pdf.stat()
+    os.utime(pdf, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert model.query(prompt, [pdf], cache=True) == "prompt:2"
+    assert model.query(prompt, [pdf], cache=True) == "prompt:2"
+    assert model.calls == ["execute"] * 2
+
+
+def test_query_cache_eviction(
+    response_cache: OrderedDict[str, str], prompt: Path, pdf: Path
+) -> None:
+    """Test the eviction of the least recently used responses."""
+    model = _StubModel()
+    for k in range(_RESPONSE_CACHE_SIZE):
+        model.query(prompt, [pdf], cache=True, index=k)
+    assert len(response_cache) == _RESPONSE_CACHE_SIZE
+    # use the first entry, which makes the second one the least recently used
+    assert model.query(prompt, [pdf], cache=True, index=0) == "prompt:1"
+    model.query(prompt, [pdf], cache=True, index=_RESPONSE_CACHE_SIZE)
+    assert len(response_cache) == _RESPONSE_CACHE_SIZE
+    assert len(model.calls) == _RESPONSE_CACHE_SIZE + 1
+    assert model.query(prompt, [pdf], cache=True, index=0) == "prompt:1"
+    assert model.query(prompt, [pdf], cache=True, index=1) == (
+        f"prompt:{_RESPONSE_CACHE_SIZE + 2}"
+    )
+
+
+def test_batch_query(prompt: Path, pdf: Path) -> None:
+    """Test querying a model through the batch hooks."""
+    model = _StubModel()
+    assert model.batch_query(prompt, [[pdf], [pdf, pdf]]) == ["prompt:1", "prompt:2"]
+    assert model.calls == ["submit", "wait"]
+    batch_id = model.submit_batch([BatchRequest(prompt, [pdf])])
+    assert model.wait_for_batch(batch_id) == ["prompt:1"]
+
+
+def test_batch_query_invalid(prompt: Path, pdf: Path) -> None:
+    """Test the validation of the batch query arguments."""
+    model = _StubModel()
+    with pytest.raises(ValueError, match="must be strictly positive"):
+        model.batch_query(prompt, [[pdf]], poll_interval=0)
+    with pytest.raises(ValueError, match="must be strictly positive"):
+        model.batch_query(prompt, [[pdf]], poll_interval=-1.0)
+    with pytest.raises(TypeError, match="'poll_interval' must be an instance of"):
+        model.batch_query(prompt, [[pdf]], poll_interval="1")
+    with pytest.raises(TypeError, match="'files' must be an instance of"):
+        model.batch_query(prompt, [pdf])
+    with pytest.raises(TypeError, match="one set of files per query"):
+        model.batch_query(prompt, [str(pdf)])
+    with pytest.raises(TypeError, match="'files' must be an instance of"):
+        model.batch_query(prompt, 101)
+    with pytest.raises(FileNotFoundError, match="does not exist"):
+        model.batch_query(prompt, [[pdf.with_name("missing.pdf")]])
+    assert model.calls == []
+    # empty input does not submit a batch
+    assert model.batch_query(prompt, []) == []
+    assert model.calls == []
+    with pytest.raises(ValueError, match="At least one request"):
+        model.submit_batch([])
+    with pytest.raises(TypeError, match="'request' must be an instance of"):
+        model.submit_batch([(prompt, [pdf])])
+    with pytest.raises(ValueError, match="must be strictly positive"):
+        model.wait_for_batch("batch-0", poll_interval=0)
+    assert model.calls == []
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+from llmde.io import read_markdown
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_read_markdown(tmp_path: Path) -> None:
+    """Test reading a markdown file, cached until it changes on disk."""
+    fname = tmp_path / "prompt.md"
+    fname.write_text("# Prompt\n", encoding="utf-8")
+    assert read_markdown(fname) == "# Prompt\n"
+    assert read_markdown(str(fname)) == "# Prompt\n"
+
+    # modify the file, with a distinct modification time
+    fname.write_text("# Updated prompt\n", encoding="utf-8")
+    stat = fname.stat()
+    os.utime(fname, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert read_markdown(fname) == "# Updated prompt\n"
+
+
+def test_read_markdown_invalid(tmp_path: Path) -> None:
+    """Test reading a markdown file that does not exist."""
+    with pytest.raises(FileNotFoundError, match="does not exist"):
+        read_markdown(tmp_path / "missing.md")
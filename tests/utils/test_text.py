@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import pytest
+
+from llmde.utils._text import strip_markdown_fences
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ('```json\n{"key": "value"}\n```', '{"key": "value"}'),
+        ('```\n{"key": "value"}\n```', '{"key": "value"}'),
+        ("  ```json\n[1, 2]\n```  \n", "[1, 2]"),
+        ('{"key": "value"}', '{"key": "value"}'),
+        ("  not fenced  ", "  not fenced  "),
+        ("```json\nunterminated", "```json\nunterminated"),
+        ("```python\nx = 1\n```", "python\nx = 1"),
+        ("```json```", ""),
+        ("````", "````"),
+    ],
+)
+def test_strip_markdown_fences(text: str, expected: str) -> None:
+    """Test stripping of markdown code fences."""
+    assert strip_markdown_fences(text) == expected